@@ -472,6 +472,7 @@ export interface Video {
   assets?: VideoAsset[];
   googleDriveFileId?: string; // Google Drive file ID for videos stored in Drive
   r2VideoUrl?: string; // Cloudflare R2 URL for published videos
+  myReaction?: "like" | "dislike" | null; // Viewer's reaction (feed only, when signed in)
 }
 
 export interface CreateVideoRequest {
@@ -509,6 +510,22 @@ export interface CreatorStats {
   creatorScore?: number;
 }
 
+// Follow nextCursor until the server reports no more pages
+const fetchAllPages = async (path: string, limit: number): Promise<Video[]> => {
+  const videos: Video[] = [];
+  let cursor: string | undefined;
+  do {
+    const params = new URLSearchParams();
+    if (cursor) params.append("cursor", cursor);
+    params.append("limit", limit.toString());
+
+    const response = await api.get<FeedResponse>(`${path}?${params.toString()}`);
+    videos.push(...response.data.videos);
+    cursor = response.data.hasMore ? response.data.nextCursor : undefined;
+  } while (cursor);
+  return videos;
+};
+
 // API Functions
 export const videoAPI = {
   // Get video feed with infinite scroll
@@ -562,17 +579,13 @@ export const videoAPI = {
     return response.data;
   },
 
-  // Get user's videos
-  getUserVideos: async (userId: string): Promise<Video[]> => {
-    const response = await api.get(`/users/${userId}/videos`);
-    return response.data;
-  },
+  // Get user's videos (all pages)
+  getUserVideos: async (userId: string, limit: number = 100): Promise<Video[]> =>
+    fetchAllPages(`/users/${userId}/videos`, limit),
 
-  // Get user's liked videos
-  getLikedVideos: async (userId: string): Promise<Video[]> => {
-    const response = await api.get(`/users/${userId}/liked`);
-    return response.data;
-  },
+  // Get user's liked videos (all pages)
+  getLikedVideos: async (userId: string, limit: number = 100): Promise<Video[]> =>
+    fetchAllPages(`/users/${userId}/liked`, limit),
 
   // Publish video (make it visible in feed)
   publishVideo: async (videoId: string): Promise<Video> => {
@@ -2,33 +2,145 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
-import os
 import secrets
+import uuid
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from urllib.parse import urlencode
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import RedirectResponse
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+import httpx
+import jwt
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from pydantic import BaseModel
-from sqlalchemy import select
+from redis.asyncio import Redis
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.settings import Settings, get_settings
-from app.db.models import Profile
+from app.db.models import Profile, derive_display_name
 from app.db.session import get_session
 from app.services.auth import AuthenticatedUser, get_current_user
+from app.services.cache import get_redis
 from app.services.security import require_signed_request
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth/google", tags=["Google OAuth"])
 
-# In-memory state storage (in production, use Redis or database)
-_oauth_states: dict[str, dict[str, str]] = {}
+# OAuth state tokens live in Redis so any worker can validate the callback
+_OAUTH_STATE_TTL_SECONDS = 600
+
+
+def _oauth_state_key(state: str) -> str:
+    return f"oauth:s:{state}"
+
+
+# Drive connection only changes on callback/sync/disconnect, so /status reads it from Redis
+_DRIVE_STATUS_TTL_SECONDS = 3600
+
+
+def _drive_status_key(user_id: uuid.UUID | str) -> str:
+    return f"gdrive:conn:{user_id}"
+
+
+async def _cache_drive_status(redis: Redis, user_id: uuid.UUID | str, is_connected: bool, email: str | None) -> None:
+    payload = orjson.dumps({"c": is_connected, "e": email})
+    await redis.set(_drive_status_key(user_id), payload, ex=_DRIVE_STATUS_TTL_SECONDS)
+
+
+GOOGLE_AUTH_URI = "https://accounts.google.com/o/oauth2/v2/auth"
+GOOGLE_TOKEN_URI = "https://oauth2.googleapis.com/token"
+GOOGLE_USERINFO_URI = "https://www.googleapis.com/oauth2/v2/userinfo"
+
+# Shared client so token exchanges reuse TLS connections to Google (closed in lifespan)
+GOOGLE_HTTP = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=20),
+    timeout=10.0,
+)
+
+
+@lru_cache(maxsize=4)
+def _base_oauth_url(client_id: str, redirect_uri: str) -> str:
+    """Consent screen URL without the per-request state parameter."""
+    params = {
+        "client_id": client_id,
+        "redirect_uri": redirect_uri,
+        "response_type": "code",
+        # Include 'openid' to avoid scope mismatch (Google may append it)
+        "scope": "https://www.googleapis.com/auth/drive.file https://www.googleapis.com/auth/userinfo.email openid",
+        "access_type": "offline",  # Get refresh token
+        "prompt": "consent",  # Force consent screen to ensure refresh token
+    }
+    return f"{GOOGLE_AUTH_URI}?{urlencode(params)}"
+
+
+async def _issue_google_auth_url(user: AuthenticatedUser, settings: Settings, redis: Redis) -> str:
+    """Store a fresh CSRF state token for the user and return the consent URL."""
+    state = secrets.token_urlsafe(24)  # 192 bits, plenty for CSRF
+    await redis.set(_oauth_state_key(state), str(user.id), ex=_OAUTH_STATE_TTL_SECONDS)
+    # token_urlsafe output needs no quoting
+    return f"{_base_oauth_url(settings.google_client_id, settings.google_redirect_uri)}&state={state}"
+
+
+@dataclass(frozen=True, slots=True)
+class GoogleTokens:
+    access_token: str
+    refresh_token: str | None
+    expiry: datetime | None
+    email: str | None  # Connected Google account, from the id_token
+
+
+async def _exchange_code(code: str, settings: Settings) -> GoogleTokens:
+    """Exchange an authorization code for Google OAuth tokens."""
+    response = await GOOGLE_HTTP.post(
+        GOOGLE_TOKEN_URI,
+        data={
+            "code": code,
+            "client_id": settings.google_client_id,
+            "client_secret": settings.google_client_secret,
+            "redirect_uri": settings.google_redirect_uri,
+            "grant_type": "authorization_code",
+        },
+    )
+    response.raise_for_status()
+    payload = response.json()
+
+    expires_in = payload.get("expires_in")
+    expiry = datetime.now(timezone.utc) + timedelta(seconds=int(expires_in)) if expires_in else None
+    return GoogleTokens(
+        access_token=payload["access_token"],
+        refresh_token=payload.get("refresh_token"),
+        expiry=expiry,
+        email=_id_token_email(payload.get("id_token")),
+    )
+
+
+def _id_token_email(id_token: str | None) -> str | None:
+    """Read the email claim from the id_token that comes with the openid scope.
+
+    The token was just received from Google's token endpoint over TLS, so its signature
+    need not be re-verified (per Google's OpenID Connect guidance).
+    """
+    if not id_token:
+        return None
+    try:
+        claims = jwt.decode(id_token, options={"verify_signature": False})
+    except jwt.InvalidTokenError:
+        return None
+    email = claims.get("email")
+    return email if isinstance(email, str) and email else None
+
+
+async def _fetch_google_email(access_token: str) -> str | None:
+    response = await GOOGLE_HTTP.get(GOOGLE_USERINFO_URI, headers={"Authorization": f"Bearer {access_token}"})
+    response.raise_for_status()
+    return response.json().get("email")
 
 
 class GoogleOAuthStatusResponse(BaseModel):
@@ -45,62 +157,64 @@ class GoogleOAuthDisconnectResponse(BaseModel):
 
 @router.get("/status", response_model=GoogleOAuthStatusResponse)
 async def google_oauth_status(
+    request: Request,
+    response: Response,
     user: AuthenticatedUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
-) -> GoogleOAuthStatusResponse:
+    redis: Redis = Depends(get_redis),
+) -> GoogleOAuthStatusResponse | Response:
     """Check if user has connected their Google Drive."""
-    stmt = select(Profile).where(Profile.id == user.id)
-    result = await session.execute(stmt)
-    profile = result.scalar_one_or_none()
-    
-    if not profile:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    cached = await redis.get(_drive_status_key(user.id))
+    if cached is not None:
+        payload = orjson.loads(cached)
+        is_connected, email = payload["c"], payload["e"]
+    else:
+        # Frontend polls this, so only fetch the two values it needs
+        stmt = select(
+            Profile.email,
+            (Profile.google_access_token.isnot(None) & Profile.google_refresh_token.isnot(None)).label("connected"),
+        ).where(Profile.id == user.id)
+        row = (await session.execute(stmt)).one_or_none()
+        
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+        
+        is_connected = bool(row.connected)
+        email = row.email if is_connected else None
+        await _cache_drive_status(redis, user.id, is_connected, email)
     
-    is_connected = bool(profile.google_access_token and profile.google_refresh_token)
+    # Let pollers revalidate cheaply and skip re-fetching within a short window
+    etag = f'"{hashlib.blake2s(f"{is_connected}:{email}".encode()).hexdigest()[:16]}"'
+    cache_headers = {"ETag": etag, "Cache-Control": "private, max-age=5"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+    response.headers.update(cache_headers)
     
-    return GoogleOAuthStatusResponse(
-        is_connected=is_connected,
-        email=profile.email if is_connected else None,
-    )
+    return GoogleOAuthStatusResponse(is_connected=is_connected, email=email)
 
 
 @router.get("/login")
 async def google_oauth_login(
     user: AuthenticatedUser = Depends(get_current_user),
     settings: Settings = Depends(get_settings),
+    redis: Redis = Depends(get_redis),
 ) -> RedirectResponse:
     """
     Initiate Google OAuth flow for Drive access.
     
     Redirects user to Google consent screen to authorize Drive access.
     """
-    # Generate state token for CSRF protection
-    state = secrets.token_urlsafe(32)
-    _oauth_states[state] = {"user_id": str(user.id)}
-    
-    # Build Google OAuth URL
-    auth_url = "https://accounts.google.com/o/oauth2/v2/auth"
-    params = {
-        "client_id": settings.google_client_id,
-        "redirect_uri": settings.google_redirect_uri,
-        "response_type": "code",
-        # Include 'openid' to avoid scope mismatch (Google may append it)
-        "scope": "https://www.googleapis.com/auth/drive.file https://www.googleapis.com/auth/userinfo.email openid",
-        "access_type": "offline",  # Get refresh token
-        "prompt": "consent",  # Force consent screen to ensure refresh token
-        "state": state,
-    }
-    
-    google_url = f"{auth_url}?{urlencode(params)}"
-    logger.info(f"Redirecting user {user.id} to Google OAuth consent screen")
+    google_url = await _issue_google_auth_url(user, settings, redis)
+    logger.info("Redirecting user %s to Google OAuth consent screen", user.id)
     
     return RedirectResponse(url=google_url)
 
 
-@router.post("/initiate")
+@router.post("/initiate", response_class=ORJSONResponse)
 async def google_oauth_initiate(
     user: AuthenticatedUser = Depends(get_current_user),
     settings: Settings = Depends(get_settings),
+    redis: Redis = Depends(get_redis),
     _: None = Depends(require_signed_request),
 ) -> dict:
     """
@@ -112,25 +226,8 @@ async def google_oauth_initiate(
     to that URL. Returning JSON allows the frontend to ensure the backend
     received the authenticated user context.
     """
-    # Generate state token for CSRF protection
-    state = secrets.token_urlsafe(32)
-    _oauth_states[state] = {"user_id": str(user.id)}
-
-    # Build Google OAuth URL
-    auth_url = "https://accounts.google.com/o/oauth2/v2/auth"
-    params = {
-        "client_id": settings.google_client_id,
-        "redirect_uri": settings.google_redirect_uri,
-        "response_type": "code",
-        # Include 'openid' to avoid scope mismatch
-        "scope": "https://www.googleapis.com/auth/drive.file https://www.googleapis.com/auth/userinfo.email openid",
-        "access_type": "offline",
-        "prompt": "consent",
-        "state": state,
-    }
-
-    google_url = f"{auth_url}?{urlencode(params)}"
-    logger.info(f"Created Google OAuth URL for user {user.id}")
+    google_url = await _issue_google_auth_url(user, settings, redis)
+    logger.info("Created Google OAuth URL for user %s", user.id)
     return {"url": google_url}
 
 
@@ -140,78 +237,56 @@ async def google_oauth_callback(
     state: str = Query(..., description="State token for CSRF protection"),
     session: AsyncSession = Depends(get_session),
     settings: Settings = Depends(get_settings),
+    redis: Redis = Depends(get_redis),
 ) -> RedirectResponse:
     """
     Handle Google OAuth callback and store tokens.
     
     Called by Google after user authorizes Drive access.
     """
-    # Verify state token
-    if state not in _oauth_states:
-        logger.error(f"Invalid OAuth state token: {state}")
+    # Verify state token (single use: GETDEL consumes it atomically)
+    user_id = await redis.getdel(_oauth_state_key(state))
+    if user_id is None:
+        logger.error("Invalid OAuth state token: %s", state)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid state token")
     
-    state_data = _oauth_states.pop(state)
-    user_id = state_data["user_id"]
-    
     try:
         # Exchange authorization code for tokens
-        logger.info(f"Exchanging OAuth code for tokens for user {user_id}")
+        logger.info("Exchanging OAuth code for tokens for user %s", user_id)
         
-        from google_auth_oauthlib.flow import Flow
+        tokens = await _exchange_code(code, settings)
         
-        flow = Flow.from_client_config(
-            {
-                "web": {
-                    "client_id": settings.google_client_id,
-                    "client_secret": settings.google_client_secret,
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "redirect_uris": [settings.google_redirect_uri],
-                }
-            },
-            scopes=[
-                "https://www.googleapis.com/auth/drive.file",
-                "https://www.googleapis.com/auth/userinfo.email",
-                "openid",
-            ],
+        profile_id = uuid.UUID(user_id)
+        # Each statement here is independently valid, so skip the BEGIN/COMMIT round trips
+        await session.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+        # The connected account's email normally comes with the token exchange (id_token);
+        # userinfo is only a fallback for responses without one
+        email = tokens.email or await _fetch_google_email(tokens.access_token)
+        values: dict[str, object] = {
+            "google_access_token": tokens.access_token,
+            "google_refresh_token": tokens.refresh_token,
+            "google_token_expiry": tokens.expiry,
+        }
+        if email:
+            values["email"] = email
+            values["display_name"] = func.coalesce(Profile.username, derive_display_name(None, email))
+        result = await session.execute(
+            update(Profile).where(Profile.id == profile_id).values(**values).returning(Profile.id)
         )
-        flow.redirect_uri = settings.google_redirect_uri
-        
-        # Fetch tokens
-        flow.fetch_token(code=code)
-        credentials = flow.credentials
-        
-        # Get user email from Google
-        user_info_service = build('oauth2', 'v2', credentials=credentials)
-        user_info = user_info_service.userinfo().get().execute()
-        user_email = user_info.get('email')
         
-        # Store tokens in database
-        stmt = select(Profile).where(Profile.id == user_id)
-        result = await session.execute(stmt)
-        profile = result.scalar_one_or_none()
-        
-        if not profile:
+        if result.one_or_none() is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
         
-        profile.google_access_token = credentials.token
-        profile.google_refresh_token = credentials.refresh_token
-        profile.google_token_expiry = credentials.expiry
-        if user_email:
-            profile.email = user_email
-        
-        session.add(profile)
-        await session.commit()
+        is_connected = bool(tokens.access_token and tokens.refresh_token)
+        await _cache_drive_status(redis, profile_id, is_connected, email if is_connected else None)
         
-        logger.info(f"Successfully stored Google OAuth tokens for user {user_id}")
+        logger.info("Successfully stored Google OAuth tokens for user %s", user_id)
         
         # Redirect to frontend create page with success parameter
-        frontend_url = os.environ.get("FRONTEND_URL", "http://localhost:3000")
-        return RedirectResponse(url=f"{frontend_url}/create?google_drive_connected=true")
+        return RedirectResponse(url=f"{settings.frontend_url}/create?google_drive_connected=true")
         
     except Exception as e:
-        logger.error(f"Failed to complete OAuth flow for user {user_id}: {e}", exc_info=True)
+        logger.error("Failed to complete OAuth flow for user %s: %s", user_id, e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to connect Google Drive: {str(e)}"
@@ -223,6 +298,7 @@ async def sync_google_tokens(
     request: dict,
     user: AuthenticatedUser = Depends(get_current_user),
     db_session: AsyncSession = Depends(get_session),
+    redis: Redis = Depends(get_redis),
     _: None = Depends(require_signed_request),
 ) -> dict:
     """
@@ -239,16 +315,14 @@ async def sync_google_tokens(
         )
     
     # Get or create profile
-    stmt = select(Profile).where(Profile.id == user.id)
-    result = await db_session.execute(stmt)
-    profile = result.scalar_one_or_none()
+    profile = await db_session.get(Profile, user.id)
     
     if not profile:
         # Create profile if it doesn't exist
         profile = Profile(
             id=user.id,
             email=user.email,
-            name=user.email.split("@")[0] if user.email else "User",
+            display_name=derive_display_name(None, user.email),
         )
     
     # Store Google tokens
@@ -262,8 +336,10 @@ async def sync_google_tokens(
     db_session.add(profile)
     await db_session.commit()
     await db_session.refresh(profile)
+    # Refresh token may have been kept from an earlier connect; let /status recompute
+    await redis.delete(_drive_status_key(user.id))
     
-    logger.info(f"Synced Google OAuth tokens for user {user.id}")
+    logger.info("Synced Google OAuth tokens for user %s", user.id)
     
     return {
         "success": True,
@@ -276,27 +352,26 @@ async def sync_google_tokens(
 async def google_oauth_disconnect(
     user: AuthenticatedUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
+    redis: Redis = Depends(get_redis),
     _: None = Depends(require_signed_request),
 ) -> GoogleOAuthDisconnectResponse:
     """
     Disconnect Google Drive and remove stored tokens.
     """
-    stmt = select(Profile).where(Profile.id == user.id)
-    result = await session.execute(stmt)
-    profile = result.scalar_one_or_none()
-    
-    if not profile:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
-    
     # Clear tokens
-    profile.google_access_token = None
-    profile.google_refresh_token = None
-    profile.google_token_expiry = None
+    result = await session.execute(
+        update(Profile)
+        .where(Profile.id == user.id)
+        .values(google_access_token=None, google_refresh_token=None, google_token_expiry=None)
+        .returning(Profile.id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
     
-    session.add(profile)
     await session.commit()
+    await _cache_drive_status(redis, user.id, False, None)
     
-    logger.info(f"Disconnected Google Drive for user {user.id}")
+    logger.info("Disconnected Google Drive for user %s", user.id)
     
     return GoogleOAuthDisconnectResponse(
         success=True,
@@ -1,20 +1,26 @@
 from __future__ import annotations
 
 import asyncio
-import io
+import base64
+import hashlib
 import logging
+import re
+import struct
 import uuid
-from datetime import datetime, timezone
-from decimal import Decimal
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import FileResponse, StreamingResponse
-from sqlalchemy import and_, func, inspect, or_, select
+from cachetools import TTLCache
+from redis.asyncio import Redis
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
+from sqlalchemy import and_, case, func, lambda_stmt, literal_column, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from starlette.background import BackgroundTask
 
 from app.core.settings import get_settings
 from app.db.models import (
@@ -25,6 +31,8 @@ from app.db.models import (
     VideoAsset,
     VideoReaction,
     VideoStatus,
+    derive_display_name,
+    uuid7,
 )
 from app.db.session import get_session
 from app.schemas.media import (
@@ -35,6 +43,7 @@ from app.schemas.media import (
     ProfileUpdateRequest,
     ReactionResponse,
     TrackViewResponse,
+    UserVideosResponse,
     VideoAssetRead,
     VideoCreateRequest,
     VideoRead,
@@ -46,21 +55,80 @@ from app.schemas.video import (
     GenerateVideoRequest,
     GenerateVideoResponse,
 )
-from app.services.auth import AuthenticatedUser, get_current_user
+from app.services.auth import AuthenticatedUser, get_current_user, get_current_user_optional
+from app.services.cache import get_redis
 from app.services.flow_client import FlowClient
+from app.services.multi_account_refresher import MultiAccountRefresher, get_account_refresher
 from app.services.security import require_signed_request
 from app.services.storage import StorageService
 from app.services.video_queue import VideoJob, VideoQueue, get_video_queue
+from app.services.view_batcher import ViewBatcher, get_view_batcher
 from app.utils.flow_status import parse_flow_status
 
 router = APIRouter()
 flow_client = FlowClient()
 storage_service = StorageService()
+# With ORM_RAISELOAD on, any relationship not loaded explicitly raises instead of lazy-loading per row
+_RAISELOAD = get_settings().orm_raiseload
 logger = logging.getLogger(__name__)
 
+# Shared client so Drive streams reuse TLS connections and multiplex over HTTP/2 (closed in lifespan)
+DRIVE_HTTP = httpx.AsyncClient(
+    http2=True,
+    follow_redirects=True,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    timeout=httpx.Timeout(30.0, read=None),
+)
+
+# Per-process read-through cache for hot videos; write paths below drop entries via _invalidate_video
+_VIDEO_CACHE: TTLCache[uuid.UUID, tuple[str, VideoRead]] = TTLCache(maxsize=10_000, ttl=30)
+# Leaderboard pages keyed by limit, same (etag, payload) shape
+_LEADERBOARD_CACHE: TTLCache[int, tuple[str, LeaderboardResponse]] = TTLCache(maxsize=64, ttl=30)
+
+# Stream lookups are shared across workers in Redis as "drive_file_id|owner_id|is_published"
+_STREAM_META_TTL_SECONDS = 300
+
+
+def _invalidate_video(video_id: uuid.UUID) -> None:
+    _VIDEO_CACHE.pop(video_id, None)
+
+
+def _stream_meta_key(video_id: uuid.UUID) -> str:
+    return f"sv:{video_id}"
+
+
+async def _get_stream_meta(
+    session: AsyncSession,
+    redis: Redis,
+    video_id: uuid.UUID,
+) -> tuple[str | None, uuid.UUID, bool]:
+    """Return (drive_file_id, owner_id, is_published) for a video, from Redis when possible."""
+    cached = await redis.get(_stream_meta_key(video_id))
+    if cached is not None:
+        parts = cached.split("|")
+        if len(parts) == 3:  # entries written before is_published was cached fall through to the DB
+            drive_file_id, owner_id, published = parts
+            return drive_file_id, uuid.UUID(owner_id), published == "1"
+
+    row = (
+        await session.execute(
+            select(Video.google_drive_file_id, Video.user_id, Video.is_published).where(Video.id == video_id)
+        )
+    ).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Video not found")
+    # Don't cache videos still waiting on their Drive upload
+    if row.google_drive_file_id:
+        await redis.set(
+            _stream_meta_key(video_id),
+            f"{row.google_drive_file_id}|{row.user_id}|{int(row.is_published)}",
+            ex=_STREAM_META_TTL_SECONDS,
+        )
+    return row.google_drive_file_id, row.user_id, row.is_published
+
 
 def calculate_ranking_score(video: Video) -> float:
-    """Simple ranking score based on likes, dislikes, and views"""
+    """Python mirror of the generated ``videos.ranking_score`` column, for rows not yet flushed"""
     likes = video.likes_count or 0
     dislikes = video.dislikes_count or 0
     views = video.views_count or 0
@@ -71,16 +139,12 @@ def calculate_ranking_score(video: Video) -> float:
     return float(engagement / (views + 1))
 
 
-def calculate_creator_score(
-    last_active_at: datetime | None,
-    videos_created: int,
-    total_likes: int,
-    total_dislikes: int,
-) -> float:
-    """Simple creator score based on activity and engagement"""
-    engagement = total_likes - total_dislikes
-    # Simple formula: engagement + videos_created
-    return float(engagement + videos_created)
+def creator_score_expr():
+    """Simple creator score based on activity and engagement: (likes - dislikes) + videos created.
+
+    Evaluated in SQL so the leaderboard sorts by the score it shows, via ix_profiles_creator_score.
+    """
+    return Profile.total_likes - Profile.total_dislikes + Profile.videos_created
 
 
 @router.get("/health")
@@ -88,59 +152,128 @@ async def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@router.post("/accounts/refresh", status_code=status.HTTP_202_ACCEPTED)
+async def refresh_accounts(
+    refresher: MultiAccountRefresher = Depends(get_account_refresher),
+    _: None = Depends(require_signed_request),
+    user: AuthenticatedUser = Depends(get_current_user),
+) -> dict[str, str]:
+    """Wake the cookie refresher now; accounts that are fresh or cooling down are still skipped."""
+    # Operators only (ADMIN_EMAILS); each wake can launch a headless browser login
+    if not user.email or user.email.lower() not in get_settings().admin_emails:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+    refresher.request_refresh()
+    return {"status": "scheduled"}
+
+
 # -----------------------------
 # Video Streaming
 # -----------------------------
 
-from fastapi.responses import StreamingResponse
-import io
+_STREAM_CHUNK_SIZE = 64 * 1024
+_STREAM_CACHE_CONTROL = "public, max-age=86400, immutable"  # Drive file ids are never rewritten
+_UNPUBLISHED_STREAM_CACHE_CONTROL = "private, no-store"  # Owner-only until published; never in shared caches
+_FEED_CACHE_CONTROL = "public, max-age=180, stale-while-revalidate=300"
+_PRIVATE_CACHE_CONTROL = "private, no-cache"  # Per-viewer payloads: revalidate via ETag every time
+_RANGE_RE = re.compile(r"bytes=(\d+)-(\d*)")
+
+
+def _parse_range_header(range_header: str | None) -> str | None:
+    """Normalise a single-range ``Range`` header for forwarding, or None to fetch everything."""
+    if not range_header:
+        return None
+    match = _RANGE_RE.fullmatch(range_header.strip())
+    if not match:
+        return None
+    start, end = match.groups()
+    if end and int(end) < int(start):
+        return None
+    return f"bytes={start}-{end}"
+
 
 @router.get("/videos/{video_id}/stream")
 async def stream_video(
     video_id: uuid.UUID,
+    request: Request,
+    range_header: str | None = Header(default=None, alias="Range"),
     session: AsyncSession = Depends(get_session),
+    redis: Redis = Depends(get_redis),
 ):
     """Proxy video streaming from Google Drive - uses authenticated download for unpublished videos"""
     try:
-        # Get video from database
-        video = await _get_video(session, video_id)
+        # Only the Drive file id and owner are needed; skip the full video load
+        drive_file_id, owner_id, is_published = await _get_stream_meta(session, redis, video_id)
+        cache_control = _STREAM_CACHE_CONTROL if is_published else _UNPUBLISHED_STREAM_CACHE_CONTROL
         
-        # Get the Google Drive file ID
-        drive_file_id = video.google_drive_file_id
         if not drive_file_id:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Video file not available"
             )
         
+        etag = f'"{drive_file_id}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": cache_control},
+            )
+        
         # Get Drive service for the video owner to download the file
-        drive_service = await storage_service.get_drive_service_for_user(session, video.user_id)
+        drive_service = await storage_service.get_drive_service_for_user(session, owner_id)
         if not drive_service:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Unable to access video storage"
             )
         
-        # Download video from Drive using authenticated service
+        # Pipe bytes Drive -> client without holding the whole file in memory
         try:
-            video_bytes = await asyncio.to_thread(drive_service.download_file, drive_file_id)
-            
-            return StreamingResponse(
-                io.BytesIO(video_bytes),
-                media_type="video/mp4",
-                headers={
-                    "Accept-Ranges": "bytes",
-                    "Content-Length": str(len(video_bytes)),
-                    "Cache-Control": "public, max-age=3600",
-                    "Access-Control-Allow-Origin": "*",
-                }
+            access_token = await asyncio.to_thread(drive_service.get_access_token)
+            upstream_headers = {"Authorization": f"Bearer {access_token}"}
+            # Forward seeks so browsers (Safari in particular) only pull what they play
+            byte_range = _parse_range_header(range_header)
+            if byte_range:
+                upstream_headers["Range"] = byte_range
+            upstream = await DRIVE_HTTP.send(
+                DRIVE_HTTP.build_request("GET", drive_service.get_media_url(drive_file_id), headers=upstream_headers),
+                stream=True,
             )
+            if upstream.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE:
+                await upstream.aclose()
+                return Response(
+                    status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                    headers={"Content-Range": upstream.headers.get("content-range", "bytes */*")},
+                )
+            if upstream.status_code >= 400:
+                await upstream.aclose()
+                raise httpx.HTTPStatusError(
+                    f"Drive returned {upstream.status_code}", request=upstream.request, response=upstream
+                )
         except Exception as download_error:
             logger.error(f"Failed to download video from Drive: {download_error}")
             raise HTTPException(
                 status_code=status.HTTP_502_BAD_GATEWAY,
                 detail="Failed to fetch video from storage"
             )
+
+        # CORS headers come from CORSMiddleware; length/range are passed through from Drive as-is
+        headers = {
+            "Accept-Ranges": "bytes",
+            "Cache-Control": cache_control,
+            "ETag": etag,
+        }
+        if "content-length" in upstream.headers:
+            headers["Content-Length"] = upstream.headers["content-length"]
+        if upstream.status_code == status.HTTP_206_PARTIAL_CONTENT:
+            headers["Content-Range"] = upstream.headers["content-range"]
+
+        return StreamingResponse(
+            upstream.aiter_bytes(chunk_size=_STREAM_CHUNK_SIZE),
+            status_code=upstream.status_code,
+            media_type=upstream.headers.get("content-type", "video/mp4"),
+            headers=headers,
+            background=BackgroundTask(upstream.aclose),
+        )
     
     except HTTPException:
         raise
@@ -213,7 +346,8 @@ async def create_video(
     session: AsyncSession = Depends(get_session),
 ) -> VideoRead:
     video, profile = await _create_and_enqueue_video(session, payload, user, queue)
-    return _serialize_video(video, creator=profile)
+    # Freshly created rows have no assets and the collection was never loaded
+    return _serialize_video(video, creator=profile, with_assets=False)
 
 
 @router.post("/videos/{video_id}/recreate", response_model=VideoRead, status_code=status.HTTP_201_CREATED)
@@ -234,7 +368,8 @@ async def recreate_video(
         sourceVideoId=original.id,
     )
     video, profile = await _create_and_enqueue_video(session, payload, user, queue)
-    return _serialize_video(video, creator=profile)
+    # Freshly created rows have no assets and the collection was never loaded
+    return _serialize_video(video, creator=profile, with_assets=False)
 
 
 @router.post("/videos/{video_id}/sync-status", response_model=VideoRead)
@@ -258,78 +393,129 @@ async def sync_video_status(
     # The video queue worker is handling all Flow API polling in the background
     # This saves API credits by not making redundant Flow API calls
     
+    _invalidate_video(video_id)
     logger.info(f"Returning cached status for video {video_id}: {video.status}")
     return _serialize_video(video)
 
 
 @router.get("/videos/feed", response_model=FeedResponse)
 async def get_feed(
+    request: Request,
+    response: Response,
     cursor: str | None = Query(default=None),
     limit: int = Query(default=10, ge=1, le=50),
     session: AsyncSession = Depends(get_session),
-) -> FeedResponse:
-    ranking_expr = func.coalesce(Video.ranking_score, 0.0)
-    query = (
-        select(Video)
+    user: AuthenticatedUser | None = Depends(get_current_user_optional),
+) -> FeedResponse | Response:
+    # lambda_stmt caches the compiled SQL per code location; closure values become bind params.
+    # Inline 0 (not a bind param) so Postgres matches the ix_videos_feed expression.
+    # creator is many-to-one, so it rides along in the main SELECT; assets stay a second query
+    query = lambda_stmt(
+        lambda: select(Video)
         .options(
-            selectinload(Video.creator),
+            joinedload(Video.creator),
             selectinload(Video.assets),
         )
         .where(
             Video.status == VideoStatus.COMPLETED,
             Video.is_published == True,  # Only show published videos in feed
         )
-        .order_by(ranking_expr.desc(), Video.created_at.desc(), Video.id.desc())
+        .order_by(
+            func.coalesce(Video.ranking_score, literal_column("0")).desc(),
+            Video.created_at.desc(),
+            Video.id.desc(),
+        )
     )
 
     if cursor:
         (cursor_score, cursor_created_at), cursor_uuid = _decode_cursor(cursor)
-        query = query.where(
-            or_(
-                ranking_expr < cursor_score,
-                and_(
-                    ranking_expr == cursor_score,
-                    Video.created_at < cursor_created_at,
-                ),
-                and_(
-                    ranking_expr == cursor_score,
-                    Video.created_at == cursor_created_at,
-                    Video.id < cursor_uuid,
-                ),
-            )
+        # Row-value comparison lets Postgres turn the cursor into a single index range scan
+        query += lambda s: s.where(
+            tuple_(func.coalesce(Video.ranking_score, literal_column("0")), Video.created_at, Video.id)
+            < tuple_(cursor_score, cursor_created_at, cursor_uuid)
         )
 
-    rows = await session.execute(query.limit(limit + 1))
-    videos = rows.scalars().all()
+    if _RAISELOAD:
+        query += lambda s: s.options(raiseload("*"))
+    fetch_limit = limit + 1
+    query += lambda s: s.limit(fetch_limit)
+    rows = await session.execute(query)
+    videos = rows.unique().scalars().all()
 
     has_more = len(videos) > limit
     items = videos[:limit]
 
+    # Signed-in viewers get their own reaction per video from one IN query
+    my_reactions: dict[uuid.UUID, ReactionType] = {}
+    if user is not None and items:
+        reaction_rows = await session.execute(
+            select(VideoReaction.video_id, VideoReaction.reaction).where(
+                VideoReaction.user_id == user.id,
+                VideoReaction.video_id.in_([video.id for video in items]),
+            )
+        )
+        my_reactions = {video_id: reaction for video_id, reaction in reaction_rows}
+
+    etag_parts = _video_etag_parts(items)
+    if user is not None:
+        etag_parts += [user.id, *sorted(f"{vid}:{r.value}" for vid, r in my_reactions.items())]
+    not_modified = _check_not_modified(
+        request,
+        response,
+        _etag(*etag_parts, has_more),
+        _FEED_CACHE_CONTROL if user is None else _PRIVATE_CACHE_CONTROL,
+        # Same URL serves the public page and per-viewer pages; shared caches must key on the token
+        vary="Authorization",
+    )
+    if not_modified is not None:
+        return not_modified
+
     # No need to refresh URLs - we use public URLs that don't expire
-    serialized = [_serialize_video(video) for video in items]
     next_cursor = _encode_cursor(items[-1]) if has_more and items else None
-    return FeedResponse(videos=serialized, next_cursor=next_cursor, has_more=has_more)
+    # Plain dicts straight to orjson (native UUID/datetime/enum encoding): no per-item Pydantic
+    # models, no response_model re-validation, no jsonable_encoder walk
+    feed = {
+        "videos": [_serialize_video_dict(video, my_reactions.get(video.id)) for video in items],
+        "nextCursor": next_cursor,
+        "hasMore": has_more,
+    }
+    return ORJSONResponse(feed, headers=dict(response.headers))
 
 
 @router.get("/videos/{video_id}", response_model=VideoRead)
 async def get_video_detail(
     video_id: uuid.UUID,
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_session),
-) -> VideoRead:
-    video = await _get_video(session, video_id)
-    # No need to refresh URLs - we use public URLs that don't expire
-    return _serialize_video(video)
+) -> VideoRead | Response:
+    cached = _VIDEO_CACHE.get(video_id)
+    if cached is None:
+        video = await _get_video(session, video_id)
+        # No need to refresh URLs - we use public URLs that don't expire
+        cached = (_etag(*_video_etag_parts([video])), _serialize_video(video))
+        _VIDEO_CACHE[video_id] = cached
+    etag, payload = cached
+    # Drafts carry owner-only Drive ids and must revalidate as soon as they are published
+    cache_control = _FEED_CACHE_CONTROL if payload.is_published else _PRIVATE_CACHE_CONTROL
+    not_modified = _check_not_modified(request, response, etag, cache_control)
+    if not_modified is not None:
+        return not_modified
+    return payload
 
 
 @router.post("/videos/{video_id}/publish")
 async def publish_video(
     video_id: uuid.UUID,
+    response: Response,
     user: AuthenticatedUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
+    redis: Redis = Depends(get_redis),
 ) -> VideoRead:
     """
     Publish a video - copies from Google Drive to R2 and makes it visible in feed.
     """
+    response.headers["Cache-Control"] = "no-store"
     video = await _get_video(session, video_id)
     
     # Check ownership
@@ -359,10 +545,11 @@ async def publish_video(
         logger.info(f"Publishing video {video_id} to R2...")
         await storage_service.upload_video_to_r2(session, video)
         
-        # Mark as published
+        # Mark as published; the commit flushes this together with the R2 fields set above
         video.is_published = True
-        session.add(video)
         await session.commit()
+        _invalidate_video(video_id)
+        await redis.delete(_stream_meta_key(video_id))
         
         logger.info(f"Successfully published video {video_id} to R2")
         return _serialize_video(video)
@@ -378,12 +565,15 @@ async def publish_video(
 @router.post("/videos/{video_id}/unpublish")
 async def unpublish_video(
     video_id: uuid.UUID,
+    response: Response,
     user: AuthenticatedUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
+    redis: Redis = Depends(get_redis),
 ) -> VideoRead:
     """
     Unpublish a video - removes it from feed and sets Drive file permissions to private.
     """
+    response.headers["Cache-Control"] = "no-store"
     video = await _get_video(session, video_id)
     
     # Check ownership
@@ -398,15 +588,11 @@ async def unpublish_video(
     drive_service = await storage_service.get_drive_service_for_user(session, user.id)
     
     if drive_service:
+        # Make Drive files private (video and thumbnail in parallel)
+        file_ids = [fid for fid in (video.google_drive_file_id, video.google_drive_thumbnail_id) if fid]
         try:
-            # Make Drive files private
-            if video.google_drive_file_id:
-                await asyncio.to_thread(drive_service.make_private, video.google_drive_file_id)
-                logger.info(f"Made video {video_id} private on Drive: {video.google_drive_file_id}")
-            
-            if video.google_drive_thumbnail_id:
-                await asyncio.to_thread(drive_service.make_private, video.google_drive_thumbnail_id)
-                logger.info(f"Made thumbnail for video {video_id} private on Drive: {video.google_drive_thumbnail_id}")
+            await asyncio.gather(*(asyncio.to_thread(drive_service.make_private, fid) for fid in file_ids))
+            logger.info(f"Made Drive files for video {video_id} private: {file_ids}")
         except Exception as e:
             logger.error(f"Failed to update Drive permissions for video {video_id}: {e}")
             raise HTTPException(
@@ -414,10 +600,13 @@ async def unpublish_video(
                 detail="Failed to update Drive permissions"
             )
     
-    # Mark as unpublished
-    video.is_published = False
-    session.add(video)
+    # Mark as unpublished with a single-column UPDATE; the loaded instance is synced in place
+    await session.execute(
+        update(Video).where(Video.id == video_id, Video.user_id == user.id).values(is_published=False)
+    )
     await session.commit()
+    _invalidate_video(video_id)
+    await redis.delete(_stream_meta_key(video_id))
     
     logger.info(f"Unpublished video {video_id}")
     return _serialize_video(video)
@@ -426,93 +615,45 @@ async def unpublish_video(
 @router.post("/videos/{video_id}/like", response_model=ReactionResponse)
 async def like_video(
     video_id: uuid.UUID,
+    response: Response,
     _: None = Depends(require_signed_request),
     user: AuthenticatedUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> ReactionResponse:
-    video = await _get_video(session, video_id)
-    actor_profile = await _ensure_profile(session, user.id, user.email)
-    owner_profile = await _ensure_profile(session, video.user_id)
-
-    reaction = await _get_reaction(session, video.id, user.id)
-    if reaction and reaction.reaction == ReactionType.LIKE:
-        return ReactionResponse(
-            video_id=video.id,
-            reaction=reaction.reaction,
-            likes=video.likes_count,
-            dislikes=video.dislikes_count,
-        )
-
-    if reaction and reaction.reaction == ReactionType.DISLIKE:
-        video.dislikes_count = max(video.dislikes_count - 1, 0)
-        owner_profile.total_dislikes = max(owner_profile.total_dislikes - 1, 0)
-        reaction.reaction = ReactionType.LIKE
-    else:
-        reaction = VideoReaction(video_id=video.id, user_id=user.id, reaction=ReactionType.LIKE)
-        session.add(reaction)
-
-    video.likes_count += 1
-    owner_profile.total_likes += 1
-    actor_profile.last_active_at = datetime.now(timezone.utc)
-    owner_profile.last_active_at = datetime.now(timezone.utc)
-    video.ranking_score = calculate_ranking_score(video)
-
-    return ReactionResponse(video_id=video.id, reaction=ReactionType.LIKE, likes=video.likes_count, dislikes=video.dislikes_count)
+    response.headers["Cache-Control"] = "no-store"
+    return await _apply_reaction(session, video_id, user, ReactionType.LIKE)
 
 
 @router.post("/videos/{video_id}/dislike", response_model=ReactionResponse)
 async def dislike_video(
     video_id: uuid.UUID,
+    response: Response,
     _: None = Depends(require_signed_request),
     user: AuthenticatedUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> ReactionResponse:
-    video = await _get_video(session, video_id)
-    actor_profile = await _ensure_profile(session, user.id, user.email)
-    owner_profile = await _ensure_profile(session, video.user_id)
-
-    reaction = await _get_reaction(session, video.id, user.id)
-    if reaction and reaction.reaction == ReactionType.DISLIKE:
-        return ReactionResponse(
-            video_id=video.id,
-            reaction=reaction.reaction,
-            likes=video.likes_count,
-            dislikes=video.dislikes_count,
-        )
-
-    if reaction and reaction.reaction == ReactionType.LIKE:
-        video.likes_count = max(video.likes_count - 1, 0)
-        owner_profile.total_likes = max(owner_profile.total_likes - 1, 0)
-        reaction.reaction = ReactionType.DISLIKE
-    else:
-        reaction = VideoReaction(video_id=video.id, user_id=user.id, reaction=ReactionType.DISLIKE)
-        session.add(reaction)
-
-    video.dislikes_count += 1
-    owner_profile.total_dislikes += 1
-    actor_profile.last_active_at = datetime.now(timezone.utc)
-    owner_profile.last_active_at = datetime.now(timezone.utc)
-    video.ranking_score = calculate_ranking_score(video)
-
-    return ReactionResponse(video_id=video.id, reaction=ReactionType.DISLIKE, likes=video.likes_count, dislikes=video.dislikes_count)
+    response.headers["Cache-Control"] = "no-store"
+    return await _apply_reaction(session, video_id, user, ReactionType.DISLIKE)
 
 
 @router.post("/videos/{video_id}/view", response_model=TrackViewResponse)
 async def track_view(
     video_id: uuid.UUID,
+    response: Response,
     _: None = Depends(require_signed_request),
     user: AuthenticatedUser = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
+    views: ViewBatcher = Depends(get_view_batcher),
 ) -> TrackViewResponse:
     """Simply increment the view counter without tracking individual views"""
-    video = await _get_video(session, video_id)
-    video.views_count += 1
-    video.ranking_score = calculate_ranking_score(video)
-
-    owner_profile = await _ensure_profile(session, video.user_id)
-    owner_profile.last_active_at = datetime.now(timezone.utc)
-
-    return TrackViewResponse(video_id=video.id, views=video.views_count)
+    response.headers["Cache-Control"] = "no-store"
+    # One PK lookup 404s unknown ids and gives the flushed total; the 30 s video cache would lag it
+    known = (await session.execute(select(Video.views_count).where(Video.id == video_id))).scalar_one_or_none()
+    if known is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Video not found")
+    # Counted in memory and flushed in batches; report the stored total plus views not yet flushed
+    pending = views.record(video_id)
+    return TrackViewResponse(video_id=video_id, views=known + pending)
 
 
 @router.get("/users/{user_id}", response_model=ProfileRead)
@@ -528,7 +669,7 @@ async def get_profile_route(
         profile = Profile(
             id=user_id,
             email=user.email,
-            last_active_at=datetime.now(timezone.utc),
+            display_name=derive_display_name(None, user.email),
         )
         session.add(profile)
         await session.flush()
@@ -551,18 +692,19 @@ async def update_profile(
         profile = Profile(
             id=user_id,
             email=user.email,
-            last_active_at=datetime.now(timezone.utc),
+            display_name=derive_display_name(None, user.email),
         )
         session.add(profile)
         await session.flush()
 
     if payload.username is not None:
         profile.username = payload.username
+        profile.display_name = derive_display_name(payload.username, profile.email)
     if payload.avatar_url is not None:
         profile.avatar_url = payload.avatar_url
     if payload.bio is not None:
         profile.bio = payload.bio
-    profile.last_active_at = datetime.now(timezone.utc)
+    profile.last_active_at = func.now()
 
     try:
         await session.flush()
@@ -573,70 +715,127 @@ async def update_profile(
     return _serialize_profile(profile)
 
 
-@router.get("/users/{user_id}/videos", response_model=list[VideoRead])
+@router.get("/users/{user_id}/videos", response_model=UserVideosResponse)
 async def list_user_videos(
     user_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=100),
     session: AsyncSession = Depends(get_session),
-) -> list[VideoRead]:
-    rows = await session.execute(
+) -> UserVideosResponse | Response:
+    query = (
         select(Video)
         .options(
-            selectinload(Video.creator),
+            joinedload(Video.creator),
             selectinload(Video.assets),
         )
         .where(Video.user_id == user_id)
-        .order_by(Video.created_at.desc())
+        .order_by(Video.created_at.desc(), Video.id.desc())
     )
-    videos = rows.scalars().all()
+    if cursor:
+        cursor_created_at, cursor_id = _decode_time_cursor(cursor)
+        query = query.where(tuple_(Video.created_at, Video.id) < tuple_(cursor_created_at, cursor_id))
+    if _RAISELOAD:
+        query = query.options(raiseload("*"))
+
+    rows = await session.execute(query.limit(limit + 1))
+    videos = rows.unique().scalars().all()
+    has_more = len(videos) > limit
+    items = videos[:limit]
+    
+    # Public caching only when the page is all published; a draft on it keeps the page private
+    all_published = all(video.is_published for video in items)
+    not_modified = _check_not_modified(
+        request,
+        response,
+        _etag(*_video_etag_parts(items), has_more),
+        _FEED_CACHE_CONTROL if all_published else _PRIVATE_CACHE_CONTROL,
+    )
+    if not_modified is not None:
+        return not_modified
     
     # No need to refresh URLs - we use public URLs that don't expire
-    return [_serialize_video(video) for video in videos]
+    next_cursor = _encode_time_cursor(items[-1].created_at, items[-1].id) if has_more and items else None
+    page = {
+        "videos": [_serialize_video_dict(video) for video in items],
+        "nextCursor": next_cursor,
+        "hasMore": has_more,
+    }
+    return ORJSONResponse(page, headers=dict(response.headers))
 
 
-@router.get("/users/{user_id}/liked", response_model=list[VideoRead])
+@router.get("/users/{user_id}/liked", response_model=UserVideosResponse)
 async def list_liked_videos(
     user_id: uuid.UUID,
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=100),
     session: AsyncSession = Depends(get_session),
-) -> list[VideoRead]:
-    rows = await session.execute(
-        select(Video)
+) -> UserVideosResponse | Response:
+    # Paged by when the like happened, so the cursor tracks the reaction row
+    query = (
+        select(Video, VideoReaction.created_at, VideoReaction.id)
         .join(VideoReaction, and_(VideoReaction.video_id == Video.id, VideoReaction.user_id == user_id))
         .options(
-            selectinload(Video.creator),
+            joinedload(Video.creator),
             selectinload(Video.assets),
         )
         .where(VideoReaction.reaction == ReactionType.LIKE)
-        .order_by(VideoReaction.created_at.desc())
+        .order_by(VideoReaction.created_at.desc(), VideoReaction.id.desc())
     )
-    videos = rows.scalars().all()
+    if cursor:
+        cursor_created_at, cursor_id = _decode_time_cursor(cursor)
+        query = query.where(
+            tuple_(VideoReaction.created_at, VideoReaction.id) < tuple_(cursor_created_at, cursor_id)
+        )
+    if _RAISELOAD:
+        query = query.options(raiseload("*"))
+
+    rows = (await session.execute(query.limit(limit + 1))).all()
+    has_more = len(rows) > limit
+    items = rows[:limit]
     
     # No need to refresh URLs - we use public URLs that don't expire
-    return [_serialize_video(video) for video in videos]
+    next_cursor = _encode_time_cursor(items[-1][1], items[-1][2]) if has_more and items else None
+    page = {
+        "videos": [_serialize_video_dict(row[0]) for row in items],
+        "nextCursor": next_cursor,
+        "hasMore": has_more,
+    }
+    return ORJSONResponse(page)
 
 
 @router.get("/users/top", response_model=LeaderboardResponse)
 async def leaderboard(
+    request: Request,
+    response: Response,
     limit: int = Query(default=10, ge=1, le=50),
     session: AsyncSession = Depends(get_session),
-) -> LeaderboardResponse:
-    rows = await session.execute(
-        select(Profile).order_by(Profile.total_likes.desc(), Profile.videos_created.desc()).limit(limit)
-    )
-    profiles = rows.scalars().all()
-
-    creators = [
-        LeaderboardEntry(
-            profile=_serialize_profile(profile),
-            score=calculate_creator_score(
-                profile.last_active_at,
-                profile.videos_created,
-                profile.total_likes,
-                profile.total_dislikes,
-            ),
+) -> LeaderboardResponse | Response:
+    # Shared by every viewer and slow-moving, so serve it from memory for a few seconds
+    cached = _LEADERBOARD_CACHE.get(limit)
+    if cached is None:
+        score = creator_score_expr()
+        query = select(Profile, score.label("score")).order_by(score.desc(), Profile.id).limit(limit)
+        if _RAISELOAD:
+            query = query.options(raiseload("*"))
+        rows = (await session.execute(query)).all()
+
+        etag = _etag(
+            *(f"{p.id}:{p.updated_at.timestamp()}:{p.total_likes}:{p.total_dislikes}:{p.videos_created}" for p, _ in rows)
         )
-        for profile in profiles
-    ]
-    return LeaderboardResponse(creators=creators)
+        creators = [
+            LeaderboardEntry(profile=_serialize_profile(profile), score=float(profile_score))
+            for profile, profile_score in rows
+        ]
+        cached = (etag, LeaderboardResponse(creators=creators))
+        _LEADERBOARD_CACHE[limit] = cached
+
+    etag, payload = cached
+    not_modified = _check_not_modified(request, response, etag, _FEED_CACHE_CONTROL)
+    if not_modified is not None:
+        return not_modified
+    return payload
 
 
 # -----------------------------
@@ -644,6 +843,32 @@ async def leaderboard(
 # -----------------------------
 
 
+def _etag(*parts: object) -> str:
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def _check_not_modified(
+    request: Request,
+    response: Response,
+    etag: str,
+    cache_control: str,
+    vary: str | None = None,
+) -> Response | None:
+    """Return a 304 if the client already holds ``etag``; otherwise stamp cache headers on ``response``."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if vary is not None:
+        headers["Vary"] = vary
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+def _video_etag_parts(videos: list[Video]) -> list[str]:
+    return [f"{v.id}:{v.updated_at.timestamp()}:{v.likes_count}:{v.dislikes_count}:{v.views_count}" for v in videos]
+
+
 def _extract_operation_name(response: dict[str, object] | None) -> str | None:
     if not isinstance(response, dict):
         return None
@@ -671,51 +896,46 @@ def _extract_error_detail(exc: httpx.HTTPStatusError) -> dict[str, object]:
     return {"message": "Flow API call failed", "upstream": upstream}
 
 
-def _serialize_video(video: Video, creator: Profile | None = None) -> VideoRead:
-    creator_profile = creator or video.creator
-    username = None
-    if creator_profile:
-        username = creator_profile.username or _safe_email_local(creator_profile.email)
-
-    ranking_score: float | None
+def _ranking_value(video: Video) -> float:
     if video.ranking_score is None:
-        ranking_score = calculate_ranking_score(video)
-    else:
-        ranking_score = float(video.ranking_score) if isinstance(video.ranking_score, Decimal) else video.ranking_score
+        return calculate_ranking_score(video)
+    return video.ranking_score
 
-    assets: list[VideoAssetRead] = []
-    
+
+def _media_urls(video: Video, raw_assets: list[VideoAsset]) -> tuple[str, str | None]:
     # For unpublished videos (drafts), use stream endpoint from Google Drive
     # For published videos, use R2 URL if available, otherwise video_url
     if not video.is_published and video.google_drive_file_id:
         video_url = f"/api/backend/videos/{video.id}/stream"
-    elif getattr(video, 'r2_video_url', None):
+    elif video.r2_video_url:
         video_url = video.r2_video_url
     else:
         video_url = video.video_url or ""
-    
-    thumbnail_url = video.thumbnail_url
-    
-    try:
-        state = inspect(video)
-    except Exception:  # noqa: BLE001 - fallback when instance inspection is unavailable
-        state = None
 
-    if state is None or "assets" not in getattr(state, "unloaded", set()):
-        raw_assets = getattr(video, "assets", None) or []
-        assets = [_serialize_asset(asset) for asset in raw_assets]
-        
-        # Extract signed URLs from assets - these take precedence over video table URLs
-        for asset in raw_assets:
-            if asset.asset_type == AssetType.VIDEO and asset.public_url:
-                video_url = asset.public_url
-            elif asset.asset_type == AssetType.THUMBNAIL and asset.public_url:
-                thumbnail_url = asset.public_url
+    thumbnail_url = video.thumbnail_url
+    # Extract signed URLs from assets - these take precedence over video table URLs
+    for asset in raw_assets:
+        if asset.asset_type == AssetType.VIDEO and asset.public_url:
+            video_url = asset.public_url
+        elif asset.asset_type == AssetType.THUMBNAIL and asset.public_url:
+            thumbnail_url = asset.public_url
+    return video_url, thumbnail_url
+
+
+def _serialize_video(
+    video: Video,
+    creator: Profile | None = None,
+    my_reaction: ReactionType | None = None,
+    with_assets: bool = True,
+) -> VideoRead:
+    creator_profile = creator or video.creator
+    raw_assets = (video.assets or []) if with_assets else []
+    video_url, thumbnail_url = _media_urls(video, raw_assets)
 
     return VideoRead(
         id=video.id,
         user_id=video.user_id,
-        username=username,
+        username=creator_profile.display_name if creator_profile else None,
         prompt=video.prompt,
         video_url=video_url,
         thumbnail_url=thumbnail_url,
@@ -724,14 +944,60 @@ def _serialize_video(video: Video, creator: Profile | None = None) -> VideoRead:
         views_count=video.views_count,
         created_at=video.created_at,
         status=video.status,
-        ranking_score=ranking_score,
+        ranking_score=_ranking_value(video),
         is_published=video.is_published,
-        assets=assets,
+        assets=[_serialize_asset(asset) for asset in raw_assets],
         google_drive_file_id=video.google_drive_file_id,
-        r2_video_url=getattr(video, 'r2_video_url', None),
+        r2_video_url=video.r2_video_url,
+        my_reaction=my_reaction,
     )
 
 
+def _serialize_video_dict(video: Video, my_reaction: ReactionType | None = None) -> dict[str, object]:
+    """``VideoRead`` wire format (by alias) built directly, for list responses that go straight to orjson.
+
+    Keys must stay in step with ``VideoRead``/``VideoAssetRead``; UUIDs, datetimes and enums are
+    left native for orjson to encode.
+    """
+    creator_profile = video.creator
+    raw_assets = video.assets or []
+    video_url, thumbnail_url = _media_urls(video, raw_assets)
+
+    return {
+        "id": video.id,
+        "userId": video.user_id,
+        "username": creator_profile.display_name if creator_profile else None,
+        "prompt": video.prompt,
+        "videoUrl": video_url,
+        "thumbnailUrl": thumbnail_url,
+        "likes": video.likes_count,
+        "dislikes": video.dislikes_count,
+        "views": video.views_count,
+        "createdAt": video.created_at,
+        "status": video.status,
+        "rankingScore": _ranking_value(video),
+        "isPublished": video.is_published,
+        "assets": [
+            {
+                "id": asset.id,
+                "assetType": asset.asset_type,
+                "storageBackend": asset.storage_backend,
+                "storageKey": asset.storage_key,
+                "filePath": asset.file_path,
+                "publicUrl": asset.public_url,
+                "sourceUrl": asset.source_url,
+                "durationSeconds": asset.duration_seconds,
+                "createdAt": asset.created_at,
+                "updatedAt": asset.updated_at,
+            }
+            for asset in raw_assets
+        ],
+        "googleDriveFileId": video.google_drive_file_id,
+        "r2VideoUrl": video.r2_video_url,
+        "myReaction": my_reaction,
+    }
+
+
 def _serialize_profile(profile: Profile) -> ProfileRead:
     return ProfileRead(
         id=profile.id,
@@ -768,8 +1034,25 @@ async def _create_and_enqueue_video(
     user: AuthenticatedUser,
     queue: VideoQueue,
 ) -> tuple[Video, Profile]:
-    # Ensure profile exists BEFORE creating video to avoid foreign key violation
-    profile = await _ensure_profile(session, user.id, user.email)
+    # Profile plus the timestamps the cooldown needs, in one round trip (both use ix_videos_user_created)
+    in_flight_at: datetime | None = None
+    last_created_at: datetime | None = None
+    row = (
+        await session.execute(
+            select(
+                Profile,
+                select(func.max(Video.created_at))
+                .where(Video.user_id == user.id, Video.status.in_([VideoStatus.PENDING, VideoStatus.PROCESSING]))
+                .scalar_subquery(),
+                select(func.max(Video.created_at)).where(Video.user_id == user.id).scalar_subquery(),
+            ).where(Profile.id == user.id)
+        )
+    ).one_or_none()
+    if row is None:
+        # Ensure profile exists BEFORE creating video to avoid foreign key violation
+        profile = await _ensure_profile(session, user.id, user.email)
+    else:
+        profile, in_flight_at, last_created_at = row
     
     # Check if user has enterprise access
     if not profile.enterprise:
@@ -779,9 +1062,9 @@ async def _create_and_enqueue_video(
         )
     
     settings = get_settings()
-    await _enforce_creation_cooldown(session, user.id, settings.video_creation_cooldown_seconds)
+    _enforce_creation_cooldown(in_flight_at, last_created_at, settings.video_creation_cooldown_seconds)
 
-    profile.last_active_at = datetime.now(timezone.utc)
+    profile.last_active_at = func.now()
 
     scene_id = payload.scene_id or str(uuid.uuid4())
     video = Video(
@@ -802,39 +1085,23 @@ async def _create_and_enqueue_video(
     return video, profile
 
 
-async def _enforce_creation_cooldown(
-    session: AsyncSession,
-    user_id: uuid.UUID,
+def _enforce_creation_cooldown(
+    in_flight_at: datetime | None,
+    last_created_at: datetime | None,
     cooldown_seconds: int,
 ) -> None:
     """
     Enforce cooldown between video creations.
-    Only checks PENDING/PROCESSING videos to allow creating new videos after completion.
+    ``in_flight_at`` is the newest PENDING/PROCESSING video, so completed videos only hit the short spam window.
     """
     if cooldown_seconds <= 0:
         return
 
-    # Check if user has any pending or processing videos
-    result = await session.execute(
-        select(Video.created_at, Video.status)
-        .where(
-            Video.user_id == user_id,
-            Video.status.in_([VideoStatus.PENDING, VideoStatus.PROCESSING])
-        )
-        .order_by(Video.created_at.desc())
-        .limit(1)
-    )
-    row = result.first()
-    
+    now = datetime.now(timezone.utc)
+
     # If there's a video still processing, enforce cooldown from its creation time
-    if row:
-        last_created_at, video_status = row
-        created_at = last_created_at
-        if created_at.tzinfo is None:
-            created_at = created_at.replace(tzinfo=timezone.utc)
-
-        now = datetime.now(timezone.utc)
-        elapsed = (now - created_at).total_seconds()
+    if in_flight_at:
+        elapsed = (now - in_flight_at).total_seconds()
         
         if elapsed < cooldown_seconds:
             remaining = int(cooldown_seconds - elapsed)
@@ -844,21 +1111,8 @@ async def _enforce_creation_cooldown(
             )
     
     # Also check the last completed/failed video for spam protection
-    result = await session.execute(
-        select(Video.created_at)
-        .where(Video.user_id == user_id)
-        .order_by(Video.created_at.desc())
-        .limit(1)
-    )
-    last_created_at = result.scalar_one_or_none()
-    
     if last_created_at:
-        created_at = last_created_at
-        if created_at.tzinfo is None:
-            created_at = created_at.replace(tzinfo=timezone.utc)
-
-        now = datetime.now(timezone.utc)
-        elapsed = (now - created_at).total_seconds()
+        elapsed = (now - last_created_at).total_seconds()
         
         # Use a shorter cooldown (10 seconds) for completed videos
         spam_protection_seconds = min(10, cooldown_seconds)
@@ -871,28 +1125,113 @@ async def _enforce_creation_cooldown(
 
 
 async def _get_video(session: AsyncSession, video_id: uuid.UUID) -> Video:
-    rows = await session.execute(
-        select(Video)
+    stmt = lambda_stmt(
+        lambda: select(Video)
         .options(
-            selectinload(Video.creator),
+            joinedload(Video.creator),
             selectinload(Video.assets),
         )
         .where(Video.id == video_id)
     )
+    if _RAISELOAD:
+        stmt += lambda s: s.options(raiseload("*"))
+    rows = await session.execute(stmt)
     video = rows.scalar_one_or_none()
     if video is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Video not found")
     return video
 
 
-async def _get_reaction(session: AsyncSession, video_id: uuid.UUID, user_id: uuid.UUID) -> VideoReaction | None:
-    rows = await session.execute(
-        select(VideoReaction).where(
-            VideoReaction.video_id == video_id,
-            VideoReaction.user_id == user_id,
+async def _apply_reaction(
+    session: AsyncSession,
+    video_id: uuid.UUID,
+    user: AuthenticatedUser,
+    new_reaction: ReactionType,
+) -> ReactionResponse:
+    """Record a like/dislike with atomic counter UPDATEs so concurrent reactions never lose increments."""
+    # Upsert the reaction; the WHERE makes a repeat of the same reaction a no-op that returns no row.
+    # xmax = 0 only for freshly inserted tuples, which tells a new reaction apart from a switch.
+    upsert = pg_insert(VideoReaction).values(
+        id=uuid7(),
+        video_id=video_id,
+        user_id=user.id,
+        reaction=new_reaction,
+    )
+    upsert = upsert.on_conflict_do_update(
+        constraint="uq_video_reactions_video_user",
+        set_={"reaction": upsert.excluded.reaction, "updated_at": func.now()},
+        where=VideoReaction.reaction != new_reaction,
+    ).returning(literal_column("xmax = 0").label("inserted"))
+    try:
+        changed = (await session.execute(upsert)).one_or_none()
+    except IntegrityError as exc:
+        # Only the videos foreign key can fail here
+        await session.rollback()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Video not found") from exc
+
+    if changed is None:
+        counts = (
+            await session.execute(select(Video.likes_count, Video.dislikes_count).where(Video.id == video_id))
+        ).one()
+        return ReactionResponse(
+            video_id=video_id,
+            reaction=new_reaction,
+            likes=counts.likes_count,
+            dislikes=counts.dislikes_count,
+        )
+
+    is_like = new_reaction == ReactionType.LIKE
+    likes, dislikes = Video.likes_count, Video.dislikes_count
+    total_likes, total_dislikes = Profile.total_likes, Profile.total_dislikes
+
+    if not changed.inserted:
+        # Switching sides: retract the previous reaction first
+        if is_like:
+            dislikes = func.greatest(dislikes - 1, 0)
+            total_dislikes = func.greatest(total_dislikes - 1, 0)
+        else:
+            likes = func.greatest(likes - 1, 0)
+            total_likes = func.greatest(total_likes - 1, 0)
+
+    if is_like:
+        likes, total_likes = likes + 1, total_likes + 1
+    else:
+        dislikes, total_dislikes = dislikes + 1, total_dislikes + 1
+
+    counts = (
+        await session.execute(
+            update(Video)
+            .where(Video.id == video_id)
+            .values(likes_count=likes, dislikes_count=dislikes)
+            .returning(Video.likes_count, Video.dislikes_count, Video.user_id)
         )
+    ).one()
+    # One UPDATE touches both profiles: the owner gets the new totals, both get last_active_at
+    is_owner = Profile.id == counts.user_id
+    touched = (
+        await session.execute(
+            update(Profile)
+            .where(Profile.id.in_({counts.user_id, user.id}))
+            .values(
+                total_likes=case((is_owner, total_likes), else_=Profile.total_likes),
+                total_dislikes=case((is_owner, total_dislikes), else_=Profile.total_dislikes),
+                last_active_at=func.now(),
+            )
+            .returning(Profile.id)
+            .execution_options(synchronize_session=False)
+        )
+    ).scalars().all()
+    # The owner row is guaranteed by the videos.user_id foreign key; only the actor may be new
+    if user.id not in touched:
+        await _insert_profile_if_missing(session, user.id, user.email)
+    _invalidate_video(video_id)
+
+    return ReactionResponse(
+        video_id=video_id,
+        reaction=new_reaction,
+        likes=counts.likes_count,
+        dislikes=counts.dislikes_count,
     )
-    return rows.scalar_one_or_none()
 
 
 async def _ensure_profile(
@@ -902,34 +1241,52 @@ async def _ensure_profile(
 ) -> Profile:
     profile = await session.get(Profile, user_id)
     if profile is None:
-        profile = Profile(
-            id=user_id,
-            email=email,
-            last_active_at=datetime.now(timezone.utc),
-        )
-        session.add(profile)
-        await session.flush()
+        await _insert_profile_if_missing(session, user_id, email)
+        profile = await session.get(Profile, user_id)
     return profile
 
 
+async def _insert_profile_if_missing(session: AsyncSession, user_id: uuid.UUID, email: str | None) -> None:
+    """Create a profile row, tolerating a concurrent request that created it first."""
+    await session.execute(
+        pg_insert(Profile)
+        .values(id=user_id, email=email, display_name=derive_display_name(None, email))
+        .on_conflict_do_nothing(index_elements=[Profile.id])
+    )
+
+
+# Feed cursor: ranking score (float64), created_at as epoch microseconds (int64), video id (16 bytes)
+_FEED_CURSOR = struct.Struct(">dq16s")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
 def _encode_cursor(video: Video) -> str:
-    score = float(video.ranking_score or 0)
-    return f"{score:.4f}|{video.created_at.isoformat()}|{video.id}"
+    packed = _FEED_CURSOR.pack(
+        video.ranking_score or 0.0,
+        (video.created_at - _EPOCH) // _MICROSECOND,
+        video.id.bytes,
+    )
+    return base64.urlsafe_b64encode(packed).rstrip(b"=").decode("ascii")
 
 
 def _decode_cursor(cursor: str) -> tuple[tuple[float, datetime], uuid.UUID]:
     try:
-        score_str, created_at_str, uuid_str = cursor.split("|", 2)
-        score = float(score_str)
-        created_at = datetime.fromisoformat(created_at_str)
-        if created_at.tzinfo is None:
-            created_at = created_at.replace(tzinfo=timezone.utc)
-        return (score, created_at), uuid.UUID(uuid_str)
-    except ValueError as exc:
+        packed = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        score, micros, id_bytes = _FEED_CURSOR.unpack(packed)
+        return (score, _EPOCH + micros * _MICROSECOND), uuid.UUID(bytes=id_bytes)
+    except (ValueError, OverflowError, struct.error) as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor format") from exc
 
 
-def _safe_email_local(email: str | None) -> str | None:
-    if not email or "@" not in email:
-        return email
-    return email.split("@", 1)[0]
+def _encode_time_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    # Always emit an explicit +00:00 so decoding is a bare C-level fromisoformat
+    return f"{created_at.astimezone(timezone.utc).isoformat()}|{row_id}"
+
+
+def _decode_time_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        created_at_str, uuid_str = cursor.split("|", 1)
+        return datetime.fromisoformat(created_at_str), uuid.UUID(uuid_str)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor format") from exc
@@ -1,20 +1,27 @@
 from __future__ import annotations
 
 import enum
+import os
+import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 
 from sqlalchemy import (
     CheckConstraint,
+    Computed,
     DateTime,
     Enum,
+    Float,
     ForeignKey,
+    Index,
     Integer,
-    Numeric,
     String,
     Text,
     UniqueConstraint,
+    and_,
     func,
+    literal_column,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -24,16 +31,33 @@ class Base(DeclarativeBase):
     """Base class for all ORM models."""
 
 
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 v7) so new primary keys land on the right edge of the B-tree."""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class TimestampMixin:
+    # Stamped client-side so the ORM knows both values after a flush without fetching them
+    # (Video and Profile still RETURN their other server-generated columns); the server
+    # default only covers rows written outside the ORM.
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=_utcnow,
         server_default=func.now(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=_utcnow,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=_utcnow,
         nullable=False,
     )
 
@@ -61,19 +85,18 @@ class Video(Base, TimestampMixin):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("profiles.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     prompt: Mapped[str] = mapped_column(Text, nullable=False)
     video_url: Mapped[str | None] = mapped_column(Text, nullable=True)
     thumbnail_url: Mapped[str | None] = mapped_column(Text, nullable=True)
     status: Mapped[VideoStatus] = mapped_column(
-        Enum(VideoStatus, name="video_status_enum", native_enum=False),
+        Enum(VideoStatus, name="video_status_enum"),
         default=VideoStatus.PENDING,
         nullable=False,
     )
@@ -85,7 +108,11 @@ class Video(Base, TimestampMixin):
     likes_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     dislikes_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     views_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
-    ranking_score: Mapped[float | None] = mapped_column(Numeric(12, 4), nullable=True)
+    # Generated by Postgres from the counters, so every counter UPDATE re-scores the row for free
+    ranking_score: Mapped[float | None] = mapped_column(
+        Float,
+        Computed("(likes_count - dislikes_count)::double precision / (views_count + 1)", persisted=True),
+    )
     operation_name: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
     scene_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
     seed: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -112,6 +139,22 @@ class Video(Base, TimestampMixin):
         cascade="all, delete-orphan",
     )
 
+    # ORM UPDATEs expire the generated ranking_score; RETURNING it keeps it readable after flush
+    __mapper_args__ = {"eager_defaults": True}
+
+
+# Keyset index for the public feed; the rank expression must match get_feed's ORDER BY
+Index(
+    "ix_videos_feed",
+    func.coalesce(Video.ranking_score, literal_column("0")).desc(),
+    Video.created_at.desc(),
+    Video.id.desc(),
+    postgresql_where=and_(Video.status == VideoStatus.COMPLETED, Video.is_published.is_(True)),
+)
+
+# Profile pages page through a user's videos newest-first; also serves user_id lookups
+Index("ix_videos_user_created", Video.user_id, Video.created_at.desc(), Video.id.desc())
+
 
 class VideoReaction(Base, TimestampMixin):
     __tablename__ = "video_reactions"
@@ -119,31 +162,56 @@ class VideoReaction(Base, TimestampMixin):
         UniqueConstraint("video_id", "user_id", name="uq_video_reactions_video_user"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     video_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("videos.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
-    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False, index=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     reaction: Mapped[ReactionType] = mapped_column(
-        Enum(ReactionType, name="video_reaction_enum", native_enum=False),
+        Enum(ReactionType, name="video_reaction_enum"),
         nullable=False,
     )
 
     video: Mapped[Video] = relationship(back_populates="reactions")
 
 
+# Per-viewer reaction lookups for a page of videos (WHERE user_id = ? AND video_id IN ...);
+# INCLUDE (reaction) makes that an index-only scan
+Index(
+    "ix_video_reactions_user_video_reaction",
+    VideoReaction.user_id,
+    VideoReaction.video_id,
+    postgresql_include=["reaction"],
+)
+
+# Liked-videos pages walk a user's reactions newest-first
+Index(
+    "ix_video_reactions_user_created",
+    VideoReaction.user_id,
+    VideoReaction.created_at.desc(),
+    VideoReaction.id.desc(),
+)
+
+
 class Profile(Base, TimestampMixin):
     __tablename__ = "profiles"
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
     username: Mapped[str | None] = mapped_column(String(64), nullable=True, unique=True)
     email: Mapped[str | None] = mapped_column(String(320), nullable=True)
+    # Name shown on videos: username, else the email local part. Kept in sync by writers
+    # so feed serialization never has to parse emails.
+    display_name: Mapped[str | None] = mapped_column(String(320), nullable=True)
     avatar_url: Mapped[str | None] = mapped_column(Text, nullable=True)
     bio: Mapped[str | None] = mapped_column(Text, nullable=True)
-    last_active_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_active_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=True,
+    )
     videos_created: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     total_likes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     total_dislikes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -153,6 +221,9 @@ class Profile(Base, TimestampMixin):
     google_refresh_token: Mapped[str | None] = mapped_column(Text, nullable=True)
     google_token_expiry: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
+    # Fetch server-side timestamps via RETURNING so async handlers can read them after flush
+    __mapper_args__ = {"eager_defaults": True}
+
     __table_args__ = (
         CheckConstraint("videos_created >= 0", name="ck_profiles_videos_created_non_negative"),
         CheckConstraint("total_likes >= 0", name="ck_profiles_total_likes_non_negative"),
@@ -167,13 +238,30 @@ class Profile(Base, TimestampMixin):
     )
 
 
+# Leaderboard: ORDER BY (total_likes - total_dislikes + videos_created) DESC, id LIMIT n
+Index(
+    "ix_profiles_creator_score",
+    # Spelled as text so the whole expression is parenthesised; Postgres rejects a bare "a + b DESC"
+    text("(total_likes - total_dislikes + videos_created) DESC"),
+    Profile.id,
+)
+
+
+def derive_display_name(username: str | None, email: str | None) -> str | None:
+    if username:
+        return username
+    if not email or "@" not in email:
+        return email
+    return email.split("@", 1)[0]
+
+
 class VideoAsset(Base, TimestampMixin):
     __tablename__ = "video_assets"
     __table_args__ = (
         UniqueConstraint("video_id", "asset_type", name="uq_video_assets_video_type"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     video_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("videos.id", ondelete="CASCADE"),
@@ -181,7 +269,7 @@ class VideoAsset(Base, TimestampMixin):
         index=True,
     )
     asset_type: Mapped[AssetType] = mapped_column(
-        Enum(AssetType, name="video_asset_type_enum", native_enum=False),
+        Enum(AssetType, name="video_asset_type_enum"),
         nullable=False,
     )
     storage_backend: Mapped[str] = mapped_column(String(32), nullable=False)
@@ -192,3 +280,4 @@ class VideoAsset(Base, TimestampMixin):
     duration_seconds: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     video: Mapped[Video] = relationship(back_populates="assets")
+
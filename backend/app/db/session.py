@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import AsyncIterator
-from typing import Optional
+from functools import lru_cache
 
 from sqlalchemy.ext.asyncio import (  # type: ignore[attr-defined]
     AsyncEngine,
@@ -9,29 +9,53 @@ from sqlalchemy.ext.asyncio import (  # type: ignore[attr-defined]
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from app.core.settings import get_settings
 from app.db.models import Base
 
-_engine: Optional[AsyncEngine] = None
-_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
-
 
+@lru_cache(maxsize=1)
 def get_engine() -> AsyncEngine:
-    global _engine, _session_factory
-    if _engine is None:
-        settings = get_settings()
-        _engine = create_async_engine(settings.database_url, echo=False, pool_pre_ping=True, future=True)
-        _session_factory = async_sessionmaker(_engine, expire_on_commit=False)
-    return _engine
+    settings = get_settings()
+    if settings.db_null_pool:
+        # PgBouncer in transaction mode cannot keep prepared statements across checkouts
+        return create_async_engine(
+            settings.database_url,
+            echo=False,
+            # SQLAlchemy's compiled cache is per-engine and unaffected by PgBouncer
+            query_cache_size=settings.db_query_cache_size,
+            pool_pre_ping=settings.db_pool_pre_ping,
+            future=True,
+            poolclass=NullPool,
+            connect_args={"statement_cache_size": 0, "prepared_statement_cache_size": 0},
+        )
+    return create_async_engine(
+        settings.database_url,
+        echo=False,
+        # Room for every lambda_stmt variant plus the queue worker's queries without LRU churn
+        query_cache_size=settings.db_query_cache_size,
+        # pool_recycle retires stale connections; a per-checkout SELECT 1 is opt-in
+        pool_pre_ping=settings.db_pool_pre_ping,
+        future=True,
+        poolclass=AsyncAdaptedQueuePool,
+        # Larger per-connection caches keep the hot queries prepared on the server
+        connect_args={
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+        },
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        # Reuse the most recently returned connection so a small warm set serves most queries
+        pool_use_lifo=True,
+    )
 
 
+@lru_cache(maxsize=1)
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
-    global _session_factory
-    if _session_factory is None:
-        get_engine()
-        assert _session_factory is not None  # pragma: no cover - for mypy
-    return _session_factory
+    return async_sessionmaker(get_engine(), expire_on_commit=False)
 
 
 async def init_database() -> None:
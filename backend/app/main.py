@@ -19,13 +19,17 @@ from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-from app.api.routes import flow_client, router, storage_service
-from app.api.auth_routes import router as auth_router
+from app.api.routes import DRIVE_HTTP, flow_client, router, storage_service
+from app.api.auth_routes import GOOGLE_HTTP, router as auth_router
 from app.core.settings import get_settings
+from app.services.auth import SUPABASE_HTTP
 from app.db.session import get_session_factory, init_database
+from app.services.cache import create_redis_client
 from app.services.multi_account_refresher import MultiAccountRefresher
 from app.services.video_queue import VideoQueue
+from app.services.view_batcher import ViewBatcher
 
 logger = logging.getLogger("uvicorn.error").getChild("lifespan")
 
@@ -35,11 +39,15 @@ async def lifespan(app: FastAPI):
     settings = get_settings()
     session_factory = get_session_factory()
     video_queue = VideoQueue(session_factory, flow_client=flow_client, storage_service=storage_service, settings=settings)
+    view_batcher = ViewBatcher(session_factory, settings=settings)
     
     # Initialize multi-account cookie refresher
     account_refresher = MultiAccountRefresher(settings)
+    redis = create_redis_client(settings)
 
     try:
+        # Created here rather than in get_settings() so loading config never touches the filesystem
+        settings.media_root.mkdir(parents=True, exist_ok=True)
         await init_database()
         
         # Start multi-account cookie refresher
@@ -49,18 +57,32 @@ async def lifespan(app: FastAPI):
         # Start the video queue worker
         await video_queue.start()
         logger.info("Video queue worker started")
+        await view_batcher.start()
         app.state.video_queue = video_queue
+        app.state.view_batcher = view_batcher
         app.state.account_refresher = account_refresher
+        app.state.redis = redis
         
         yield
     finally:
         # Cleanup
         await account_refresher.stop()
         await video_queue.stop()
+        await view_batcher.stop()
+        await redis.aclose()
+        await GOOGLE_HTTP.aclose()
+        await SUPABASE_HTTP.aclose()
+        await DRIVE_HTTP.aclose()
+        await flow_client.aclose()
         logger.info("Application shutdown complete")
 
 
-app = FastAPI(title="Flow Veo3 Proxy", version="0.2.0", lifespan=lifespan)
+app = FastAPI(
+    title="Flow Veo3 Proxy",
+    version="0.2.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # Add CORS middleware to allow frontend to make requests
 app.add_middleware(
@@ -60,6 +60,7 @@ class VideoRead(BaseModel):
     assets: list[VideoAssetRead] = Field(default_factory=list)
     google_drive_file_id: str | None = Field(None, alias="googleDriveFileId")
     r2_video_url: str | None = Field(None, alias="r2VideoUrl")
+    my_reaction: ReactionType | None = Field(None, alias="myReaction")
 
 
 class FeedResponse(BaseModel):
@@ -70,6 +71,14 @@ class FeedResponse(BaseModel):
     has_more: bool = Field(..., alias="hasMore")
 
 
+class UserVideosResponse(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    videos: list[VideoRead]
+    next_cursor: str | None = Field(None, alias="nextCursor")
+    has_more: bool = Field(..., alias="hasMore")
+
+
 class ReactionResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
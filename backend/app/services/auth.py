@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import uuid
 from dataclasses import dataclass
+from functools import lru_cache
 
 import httpx
+import jwt
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
@@ -11,6 +16,13 @@ from app.core.settings import get_settings
 
 _bearer_scheme = HTTPBearer(auto_error=False)
 
+# Shared client so session lookups reuse TLS connections to Supabase (closed in lifespan)
+SUPABASE_HTTP = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=20),
+    timeout=10.0,
+)
+
 
 @dataclass(frozen=True)
 class AuthenticatedUser:
@@ -23,16 +35,48 @@ class SupabaseAuthClient:
         settings = get_settings()
         self._api_base = settings.supabase_url.rstrip("/")
         self._anon_key = settings.supabase_anon_key
+        self._jwt_secret = settings.supabase_jwt_secret
+        # Keyed by sha256(token) so raw tokens never sit in memory; short TTL so revocations land quickly
+        self._users: TTLCache[bytes, AuthenticatedUser] = TTLCache(maxsize=10_000, ttl=60)
+        self._lookups: dict[bytes, asyncio.Task[AuthenticatedUser]] = {}
 
     async def get_user(self, access_token: str) -> AuthenticatedUser:
+        if self._jwt_secret:
+            return self._decode_user(access_token)
+
+        key = hashlib.sha256(access_token.encode("utf-8")).digest()
+        user = self._users.get(key)
+        if user is not None:
+            return user
+
+        # Concurrent requests carrying the same token share one Supabase call
+        task = self._lookups.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_user(access_token))
+            self._lookups[key] = task
+            task.add_done_callback(lambda _: self._lookups.pop(key, None))
+        user = await asyncio.shield(task)
+        self._users[key] = user
+        return user
+
+    def _decode_user(self, access_token: str) -> AuthenticatedUser:
+        """Verify a Supabase access token against the project's JWT secret, with no network call."""
+        try:
+            claims = jwt.decode(access_token, self._jwt_secret, algorithms=["HS256"], audience="authenticated")
+            user_id = uuid.UUID(claims["sub"])
+        except (jwt.InvalidTokenError, KeyError, ValueError, AttributeError) as exc:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid Supabase session") from exc
+
+        return AuthenticatedUser(id=user_id, email=claims.get("email"))
+
+    async def _fetch_user(self, access_token: str) -> AuthenticatedUser:
         url = f"{self._api_base}/auth/v1/user"
         headers = {
             "Authorization": f"Bearer {access_token}",
             "apikey": self._anon_key,
         }
 
-        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
-            response = await client.get(url, headers=headers)
+        response = await SUPABASE_HTTP.get(url, headers=headers)
 
         if response.status_code != status.HTTP_200_OK:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid Supabase session")
@@ -46,14 +90,9 @@ class SupabaseAuthClient:
         return AuthenticatedUser(id=user_id, email=data.get("email"))
 
 
-_client: SupabaseAuthClient | None = None
-
-
+@lru_cache(maxsize=1)
 def get_auth_client() -> SupabaseAuthClient:
-    global _client
-    if _client is None:
-        _client = SupabaseAuthClient()
-    return _client
+    return SupabaseAuthClient()
 
 
 async def get_current_user(
@@ -68,3 +107,13 @@ async def get_current_user(
 
     auth_client = get_auth_client()
     return await auth_client.get_user(token)
+
+
+async def get_current_user_optional(
+    credentials: HTTPAuthorizationCredentials | None = Depends(_bearer_scheme),
+) -> AuthenticatedUser | None:
+    """Like ``get_current_user`` but returns None for anonymous or invalid sessions."""
+    try:
+        return await get_current_user(credentials)
+    except HTTPException:
+        return None
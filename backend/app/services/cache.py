@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from fastapi import Request
+from redis.asyncio import Redis
+
+from app.core.settings import Settings
+
+
+def create_redis_client(settings: Settings) -> Redis:
+    """Build the pooled Redis client shared by all workers of this process."""
+    return Redis.from_url(settings.redis_url, decode_responses=True)
+
+
+def get_redis(request: Request) -> Redis:
+    redis: Redis | None = getattr(request.app.state, "redis", None)
+    if redis is None:
+        raise RuntimeError("Redis client is not initialised")
+    return redis
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import secrets
 from typing import Any, Dict, Tuple
 from uuid import uuid4
 
 import httpx
+import orjson
 
 from app.core.settings import Settings, get_settings
 from app.schemas.video import CheckVideoStatusRequest, GenerateVideoRequest
@@ -38,6 +39,13 @@ class FlowClient:
     def __init__(self, settings: Settings | None = None) -> None:
         self._settings_override = settings
         self._cookie_manager: MultiAccountCookieManager | None = None
+        # One pooled client for all Flow calls; cookies go in an explicit header per request
+        # so accounts never share the client's cookie jar
+        self._http = httpx.AsyncClient(timeout=httpx.Timeout(30.0))
+        self._token_fetches: Dict[str, asyncio.Task[Dict[str, str]]] = {}
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
 
     def _get_cookie_manager(self, settings: Settings) -> MultiAccountCookieManager:
         """Get or create the multi-account cookie manager"""
@@ -156,29 +164,16 @@ class FlowClient:
             logger.info(f"Fetching access token for {account['email']}")
             
             try:
-                from app.services.token_refresher import TokenRefresher
-                settings = self._settings_override or get_settings()
-                token_refresher = TokenRefresher(settings)
-                
-                # Fetch session data (includes access token)
-                session_data = await token_refresher.fetch_session(current_cookies)
-                
-                # Add token to cookies
-                current_cookies = token_refresher.persist_token_to_cookies(
-                    account['email'],
-                    session_data,
-                    current_cookies
-                )
-                
-                # Update cookie manager with new token
-                cookie_manager.update_cookies(
-                    account['email'],
-                    current_cookies,
-                    session_data.expires.isoformat()
-                )
-                
-                bearer_token = session_data.access_token
-                logger.info(f"✅ Access token fetched for {account['email']}")
+                # Concurrent requests for the same account share one in-flight fetch
+                email = account['email']
+                task = self._token_fetches.get(email)
+                if task is None:
+                    task = asyncio.create_task(self._fetch_access_token(cookie_manager, email, current_cookies))
+                    self._token_fetches[email] = task
+                    task.add_done_callback(lambda _: self._token_fetches.pop(email, None))
+                # Shielded so one cancelled request does not abort the fetch for the others
+                current_cookies = await asyncio.shield(task)
+                bearer_token = current_cookies["authorization"]
                 
             except Exception as e:
                 logger.error(f"Failed to fetch access token for {account['email']}: {e}")
@@ -189,18 +184,34 @@ class FlowClient:
             bearer_token=bearer_token
         )
 
+    async def _fetch_access_token(
+        self, cookie_manager: MultiAccountCookieManager, email: str, cookies: Dict[str, str]
+    ) -> Dict[str, str]:
+        """Fetch a session token for ``email`` and store it with the account's cookies"""
+        from app.services.token_refresher import TokenRefresher
+        settings = self._settings_override or get_settings()
+        token_refresher = TokenRefresher(settings)
+        
+        # Fetch session data (includes access token)
+        session_data = await token_refresher.fetch_session(cookies)
+        
+        # Add token to cookies and update cookie manager with it
+        cookies = token_refresher.persist_token_to_cookies(email, session_data, cookies)
+        cookie_manager.update_cookies(email, cookies, session_data.expires.isoformat())
+        
+        logger.info(f"✅ Access token fetched for {email}")
+        return cookies
+
     async def _post(
         self, url: str, payload: Dict[str, Any], credentials: CookieCredentials
     ) -> Tuple[Dict[str, Any], Dict[str, str], str | None]:
-        headers = {**_DEFAULT_HEADERS, "authorization": _format_bearer(credentials)}
+        headers = {
+            **_DEFAULT_HEADERS,
+            "authorization": _format_bearer(credentials),
+            "cookie": "; ".join(f"{name}={value}" for name, value in credentials.cookies.items()),
+        }
 
-        async with httpx.AsyncClient(timeout=httpx.Timeout(30.0)) as client:
-            response = await client.post(
-                url,
-                headers=headers,
-                cookies=credentials.cookies,
-                content=json.dumps(payload),
-            )
+        response = await self._http.post(url, headers=headers, content=orjson.dumps(payload))
 
         snippet_success = response.text.strip()
         headers_out = {k.lower(): v for k, v in response.headers.items()}
@@ -237,8 +248,8 @@ class FlowClient:
             return {}, headers_out, request_id
 
         try:
-            return response.json(), headers_out, request_id
-        except ValueError as exc:
+            return orjson.loads(response.content), headers_out, request_id
+        except orjson.JSONDecodeError as exc:
             raise RuntimeError("Flow API returned a non-JSON payload") from exc
 
     def _build_generate_payload(self, settings: Settings, request: GenerateVideoRequest) -> Dict[str, Any]:
@@ -69,6 +69,30 @@ class GoogleDriveService:
         
         return self._drive_service
 
+    def get_access_token(self) -> str:
+        """
+        Return a valid access token, refreshing it first if it has expired.
+
+        Blocking (may hit Google's token endpoint); call via ``asyncio.to_thread``.
+        """
+        if self._credentials.expired and self._credentials.refresh_token:
+            logger.info("Refreshing expired Google OAuth token")
+            self._credentials.refresh(Request())
+        return self._credentials.token
+
+    @staticmethod
+    def get_media_url(file_id: str) -> str:
+        """
+        Get the Drive API URL that serves a file's raw bytes.
+
+        Args:
+            file_id: Google Drive file ID
+
+        Returns:
+            Media download URL (requires a Bearer access token)
+        """
+        return f"https://www.googleapis.com/drive/v3/files/{file_id}?alt=media"
+
     def get_updated_tokens(self) -> tuple[str, datetime | None]:
         """
         Get updated access token and expiry after potential refresh.
@@ -8,22 +8,25 @@ import logging
 import random
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
+_COOLDOWN_BASE = timedelta(minutes=10)
+_COOLDOWN_MAX = timedelta(hours=4)
+
 
 class MultiAccountCookieManager:
     """Manages cookies for multiple Google accounts with rotation and failover"""
 
-    def __init__(self, cookie_file: Path, emails: List[str], passwords: List[str]):
+    def __init__(self, cookie_file: Path, emails: Sequence[str], passwords: Sequence[str]):
         """
         Initialize multi-account cookie manager
         
         Args:
             cookie_file: Path to cookie.json file
-            emails: List of Google account emails
-            passwords: List of corresponding passwords
+            emails: Google account emails
+            passwords: Corresponding passwords
         """
         if len(emails) != len(passwords):
             raise ValueError("Number of emails must match number of passwords")
@@ -211,9 +214,11 @@ class MultiAccountCookieManager:
         # Apply cooldown after 3 failures
         if health["failures"] >= 3:
             health["is_healthy"] = False
-            # Cooldown for 10 minutes
-            health["cooldown_until"] = datetime.now(timezone.utc) + timedelta(minutes=10)
-            logger.warning(f"Account {email} marked unhealthy (failures: {health['failures']}), cooldown until {health['cooldown_until']}")
+            # 10 minutes, doubling per further failure up to 4 hours, so a broken login
+            # stops relaunching the browser every check while a transient one recovers fast
+            cooldown = min(_COOLDOWN_BASE * 2 ** (health["failures"] - 3), _COOLDOWN_MAX)
+            health["cooldown_until"] = datetime.now(timezone.utc) + cooldown
+            logger.warning(f"Account {email} marked unhealthy (failures: {health['failures']}), cooldown {cooldown} until {health['cooldown_until']}")
         else:
             logger.info(f"Account {email} failure #{health['failures']}")
 
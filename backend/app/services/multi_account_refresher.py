@@ -9,6 +9,8 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from fastapi import Request
+
 from app.services.multi_account_cookies import MultiAccountCookieManager
 
 if TYPE_CHECKING:
@@ -31,6 +33,8 @@ class MultiAccountRefresher:
         )
         self._task: asyncio.Task | None = None
         self._stop_event = asyncio.Event()
+        # Set by stop() or request_refresh() to cut the sleep between checks short
+        self._wake = asyncio.Event()
 
     async def start(self) -> None:
         """Start the background refresh task"""
@@ -40,6 +44,7 @@ class MultiAccountRefresher:
 
         logger.info(f"Starting multi-account cookie refresher for {len(self.settings.google_emails)} accounts")
         self._stop_event.clear()
+        self._wake.clear()
         self._task = asyncio.create_task(self._refresh_loop())
 
     async def stop(self) -> None:
@@ -49,6 +54,7 @@ class MultiAccountRefresher:
 
         logger.info("Stopping multi-account cookie refresher")
         self._stop_event.set()
+        self._wake.set()
 
         try:
             await asyncio.wait_for(self._task, timeout=5.0)
@@ -72,15 +78,12 @@ class MultiAccountRefresher:
             except Exception as e:
                 logger.error(f"Error in multi-account refresh loop: {e}", exc_info=True)
 
-            # Wait for next check or stop signal
+            # Wait for next check, an early refresh request or stop signal
             try:
-                await asyncio.wait_for(
-                    self._stop_event.wait(),
-                    timeout=COOKIE_CHECK_INTERVAL
-                )
-                break  # Stop event was set
+                await asyncio.wait_for(self._wake.wait(), timeout=COOKIE_CHECK_INTERVAL)
             except asyncio.TimeoutError:
-                continue  # Timeout reached, continue loop
+                pass
+            self._wake.clear()
 
         logger.info("Multi-account refresh loop stopped")
 
@@ -397,6 +400,10 @@ class MultiAccountRefresher:
             # Mark the account as failed
             self.cookie_manager.mark_account_failure(email)
 
+    def request_refresh(self) -> None:
+        """Run the next account check now instead of waiting out COOKIE_CHECK_INTERVAL"""
+        self._wake.set()
+
     def get_account_health(self) -> list[dict]:
         """Get health status of all accounts"""
         return self.cookie_manager.get_account_status()
@@ -407,3 +414,10 @@ async def start_multi_account_refresher(settings: "Settings") -> MultiAccountRef
     refresher = MultiAccountRefresher(settings)
     await refresher.start()
     return refresher
+
+
+def get_account_refresher(request: Request) -> MultiAccountRefresher:
+    refresher: MultiAccountRefresher | None = getattr(request.app.state, "account_refresher", None)
+    if refresher is None:
+        raise RuntimeError("Account refresher is not initialised")
+    return refresher
@@ -13,8 +13,8 @@ from app.core.settings import get_settings
 async def require_signed_request(request: Request) -> None:
     """Validate an HMAC signature on incoming requests when a secret is configured."""
     settings = get_settings()
-    secret = settings.request_signature_secret
-    if not secret:
+    key = settings.request_signature_key
+    if not key:
         return
 
     signature_header = settings.request_signature_header
@@ -44,7 +44,7 @@ async def require_signed_request(request: Request) -> None:
         path=request.url.path,
         body=body,
     )
-    expected_signature = _compute_signature(secret, message)
+    expected_signature = _compute_signature(key, message)
 
     if not hmac.compare_digest(expected_signature, provided_signature):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid request signature")
@@ -58,6 +58,6 @@ def _build_signature_payload(*, timestamp: str, method: str, path: str, body: by
     return payload.encode("utf-8")
 
 
-def _compute_signature(secret: str, payload: bytes) -> str:
-    digest = hmac.new(secret.encode("utf-8"), payload, hashlib.sha256).hexdigest()
+def _compute_signature(key: bytes, payload: bytes) -> str:
+    digest = hmac.new(key, payload, hashlib.sha256).hexdigest()
     return digest
@@ -6,7 +6,8 @@ import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy import update as sql_update
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import selectinload
 
@@ -118,7 +119,6 @@ class VideoQueue:
         profile.last_active_at = datetime.now(timezone.utc)
         video.status = VideoStatus.PROCESSING
         video.failure_reason = None
-        video.ranking_score = 0.0  # Default ranking score
         await session.commit()
 
     async def _run_generation(self, session: AsyncSession, video: Video, scene_id: str) -> None:
@@ -201,6 +201,7 @@ class VideoQueue:
         raise asyncio.TimeoutError(error_msg)
 
     async def _apply_status_update(self, session: AsyncSession, video: Video, update: FlowStatusUpdate) -> None:
+        newly_completed = update.status == VideoStatus.COMPLETED and video.status != VideoStatus.COMPLETED
         if update.status is not None:
             video.status = update.status
         if update.failure_reason:
@@ -222,20 +223,23 @@ class VideoQueue:
             video.failure_reason = error_msg
             raise RuntimeError(error_msg) from e
         
-        profile = await session.get(Profile, video.user_id)
-        if profile:
-            if update.status == VideoStatus.COMPLETED and video.status != VideoStatus.COMPLETED:
-                profile.videos_created += 1
-            profile.last_active_at = datetime.now(timezone.utc)
+        # Single atomic UPDATE instead of loading the profile and writing the counter back
+        values: dict[str, object] = {"last_active_at": func.now()}
+        if newly_completed:
+            values["videos_created"] = Profile.videos_created + 1
+        await session.execute(
+            sql_update(Profile)
+            .where(Profile.id == video.user_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
 
-        video.ranking_score = 0.0  # Default ranking score
         await session.commit()
 
     async def _mark_failed(self, session: AsyncSession, video: Video, *, reason: str | None) -> None:
         """Mark video as failed with descriptive error message."""
         video.status = VideoStatus.FAILED
         video.failure_reason = reason or "Unknown error occurred during video generation"
-        video.ranking_score = 0.0  # Default ranking score
         
         logger.error(
             f"Marking video {video.id} as failed: {video.failure_reason}",
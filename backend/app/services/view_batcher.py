@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections import Counter
+
+from fastapi import Request
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.settings import Settings, get_settings
+from app.db.models import Profile, Video
+
+logger = logging.getLogger("uvicorn.error").getChild("view_batcher")
+
+
+class ViewBatcher:
+    """Coalesces view increments in memory and writes them in one executemany per window."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        settings: Settings | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._settings = settings or get_settings()
+        self._pending: Counter[uuid.UUID] = Counter()
+        self._stop_event = asyncio.Event()
+        self._worker_task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        if self._worker_task is None:
+            self._stop_event.clear()
+            self._worker_task = asyncio.create_task(self._worker_loop(), name="view-batcher")
+
+    async def stop(self) -> None:
+        self._stop_event.set()
+        if self._worker_task:
+            # Not cancelled: a flush in progress finishes (or requeues) before the worker exits
+            await self._worker_task
+            self._worker_task = None
+        # Don't drop views that arrived during the last window
+        try:
+            await self._flush()
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Failed to flush view counts on shutdown: %s", exc)
+
+    def record(self, video_id: uuid.UUID) -> int:
+        """Queue one view and return how many are pending for this video."""
+        self._pending[video_id] += 1
+        return self._pending[video_id]
+
+    async def _worker_loop(self) -> None:
+        interval = self._settings.view_flush_interval_ms / 1000
+        while not self._stop_event.is_set():
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self._flush()
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("Failed to flush view counts: %s", exc)
+
+    async def _flush(self) -> None:
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, Counter()
+
+        videos = Video.__table__
+        stmt = (
+            videos.update()
+            .where(videos.c.id == bindparam("video_id"))
+            .values(views_count=videos.c.views_count + bindparam("delta"))
+        )
+        params = [{"video_id": video_id, "delta": delta} for video_id, delta in batch.items()]
+        try:
+            async with self._session_factory() as session:
+                await session.execute(stmt, params)
+                await session.execute(
+                    update(Profile)
+                    .where(Profile.id.in_(select(Video.user_id).where(Video.id.in_(list(batch)))))
+                    .values(last_active_at=func.now())
+                )
+                await session.commit()
+        except BaseException:
+            # Put the counts back so the next window retries them, cancellation included
+            self._pending.update(batch)
+            raise
+
+
+def get_view_batcher(request: Request) -> ViewBatcher:
+    batcher: ViewBatcher | None = getattr(request.app.state, "view_batcher", None)
+    if batcher is None:
+        raise RuntimeError("View batcher is not initialised")
+    return batcher
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+import orjson
 
 _BEARER_TOKEN_NAMES: Tuple[str, ...] = (
     "authorization",
@@ -20,7 +20,26 @@ class CookieCredentials:
     bearer_token: str
 
 
+# Parsed credentials per file, keyed on st_mtime_ns so a rewrite by the refresh job is picked up
+_CREDENTIALS_CACHE: Dict[Path, Tuple[int, CookieCredentials]] = {}
+
+
 def load_cookie_credentials(cookie_file: Path) -> CookieCredentials:
+    try:
+        mtime_ns = cookie_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Cookie file not found: {cookie_file}") from None
+
+    cached = _CREDENTIALS_CACHE.get(cookie_file)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    credentials = _parse_cookie_credentials(cookie_file)
+    _CREDENTIALS_CACHE[cookie_file] = (mtime_ns, credentials)
+    return credentials
+
+
+def _parse_cookie_credentials(cookie_file: Path) -> CookieCredentials:
     data = load_cookie_entries(cookie_file)
     cookies: Dict[str, str] = {}
     bearer_token: str | None = None
@@ -75,8 +94,7 @@ def load_cookie_entries(cookie_file: Path) -> List[Dict[str, Any]]:
     if not cookie_file.exists():
         raise FileNotFoundError(f"Cookie file not found: {cookie_file}")
 
-    with cookie_file.open("r", encoding="utf-8") as fh:
-        data = json.load(fh)
+    data = orjson.loads(cookie_file.read_bytes())
 
     if not isinstance(data, list):
         raise ValueError("Cookie file must contain a JSON array")
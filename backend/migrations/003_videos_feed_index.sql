@@ -0,0 +1,7 @@
+-- Keyset pagination index for GET /videos/feed.
+-- Partial: only published, completed videos ever appear in the feed.
+-- Run outside a transaction (CONCURRENTLY): psql $DATABASE_URL -f migrations/003_videos_feed_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_videos_feed
+    ON videos ((COALESCE(ranking_score, 0)) DESC, created_at DESC, id DESC)
+    WHERE status = 'COMPLETED' AND is_published = true;
@@ -0,0 +1,8 @@
+-- Keyset pagination indexes for GET /users/{id}/videos and GET /users/{id}/liked.
+-- Run outside a transaction (CONCURRENTLY): psql $DATABASE_URL -f migrations/004_user_list_indexes.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_videos_user_created
+    ON videos (user_id, created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_video_reactions_user_created
+    ON video_reactions (user_id, created_at DESC, id DESC);
@@ -0,0 +1,5 @@
+-- Lets GET /videos/feed fetch the viewer's reactions for a page with one index scan.
+-- Run outside a transaction (CONCURRENTLY): psql $DATABASE_URL -f migrations/005_video_reactions_user_video_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_video_reactions_user_video
+    ON video_reactions (user_id, video_id);
@@ -0,0 +1,8 @@
+-- Stores the creator name shown on videos so feed serialization does not derive it per row.
+-- psql $DATABASE_URL -f migrations/006_profiles_display_name.sql
+
+ALTER TABLE profiles ADD COLUMN IF NOT EXISTS display_name VARCHAR(320);
+
+UPDATE profiles
+SET display_name = COALESCE(username, split_part(email, '@', 1))
+WHERE display_name IS NULL;
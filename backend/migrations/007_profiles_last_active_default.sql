@@ -0,0 +1,4 @@
+-- New profiles take last_active_at from the database clock instead of the API process.
+-- psql $DATABASE_URL -f migrations/007_profiles_last_active_default.sql
+
+ALTER TABLE profiles ALTER COLUMN last_active_at SET DEFAULT now();
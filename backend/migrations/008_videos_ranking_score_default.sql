@@ -0,0 +1,9 @@
+-- ranking_score is only written by the reaction/view UPDATEs now; give new rows a 0 default
+-- and fill any legacy NULLs with the same formula (likes - dislikes) / (views + 1).
+-- psql $DATABASE_URL -f migrations/008_videos_ranking_score_default.sql
+
+ALTER TABLE videos ALTER COLUMN ranking_score SET DEFAULT 0;
+
+UPDATE videos
+SET ranking_score = (likes_count - dislikes_count)::numeric / (views_count + 1)
+WHERE ranking_score IS NULL;
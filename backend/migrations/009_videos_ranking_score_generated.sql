@@ -0,0 +1,20 @@
+-- Turn videos.ranking_score into a stored generated column so Postgres re-scores a row
+-- whenever its counters change. Postgres cannot convert a column in place, so the column
+-- (and the feed index built on it) is dropped and recreated; this rewrites the table.
+-- psql $DATABASE_URL -f migrations/009_videos_ranking_score_generated.sql
+
+BEGIN;
+
+DROP INDEX IF EXISTS ix_videos_feed;
+
+ALTER TABLE videos DROP COLUMN ranking_score;
+
+ALTER TABLE videos
+    ADD COLUMN ranking_score NUMERIC(12, 4)
+    GENERATED ALWAYS AS ((likes_count - dislikes_count)::numeric / (views_count + 1)) STORED;
+
+CREATE INDEX ix_videos_feed
+    ON videos ((COALESCE(ranking_score, 0)) DESC, created_at DESC, id DESC)
+    WHERE status = 'COMPLETED' AND is_published = true;
+
+COMMIT;
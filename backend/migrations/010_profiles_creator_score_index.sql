@@ -0,0 +1,5 @@
+-- Lets GET /users/top read the top-N creators by score straight off an index.
+-- Run outside a transaction (CONCURRENTLY): psql $DATABASE_URL -f migrations/010_profiles_creator_score_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_profiles_creator_score
+    ON profiles ((total_likes - total_dislikes + videos_created) DESC, id);
@@ -0,0 +1,8 @@
+-- Replace the (user_id, video_id) reaction index with a covering one so the feed's
+-- "my reactions" lookup never touches the heap.
+-- Run outside a transaction (CONCURRENTLY): psql $DATABASE_URL -f migrations/011_video_reactions_covering_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_video_reactions_user_video_reaction
+    ON video_reactions (user_id, video_id) INCLUDE (reaction);
+
+DROP INDEX CONCURRENTLY IF EXISTS ix_video_reactions_user_video;
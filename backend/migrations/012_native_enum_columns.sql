@@ -0,0 +1,22 @@
+-- Store videos.status, video_reactions.reaction and video_assets.asset_type as native
+-- Postgres enums (4 bytes, OID comparison) instead of VARCHAR. Labels are the enum member
+-- names, which is what SQLAlchemy already writes. Each ALTER rewrites its table and rebuilds
+-- dependent indexes (including the partial ix_videos_feed predicate).
+-- psql $DATABASE_URL -f migrations/012_native_enum_columns.sql
+
+BEGIN;
+
+CREATE TYPE video_status_enum AS ENUM ('PENDING', 'PROCESSING', 'COMPLETED', 'FAILED');
+CREATE TYPE video_reaction_enum AS ENUM ('LIKE', 'DISLIKE');
+CREATE TYPE video_asset_type_enum AS ENUM ('VIDEO', 'THUMBNAIL');
+
+ALTER TABLE videos
+    ALTER COLUMN status TYPE video_status_enum USING status::video_status_enum;
+
+ALTER TABLE video_reactions
+    ALTER COLUMN reaction TYPE video_reaction_enum USING reaction::video_reaction_enum;
+
+ALTER TABLE video_assets
+    ALTER COLUMN asset_type TYPE video_asset_type_enum USING asset_type::video_asset_type_enum;
+
+COMMIT;
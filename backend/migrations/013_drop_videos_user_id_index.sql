@@ -0,0 +1,6 @@
+-- ix_videos_user_created (user_id, created_at DESC, id DESC) already serves every lookup by
+-- user_id, including the profiles FK cascade, so the single-column index is dead weight on
+-- every insert and counter update.
+-- Run outside a transaction (CONCURRENTLY): psql $DATABASE_URL -f migrations/013_drop_videos_user_id_index.sql
+
+DROP INDEX CONCURRENTLY IF EXISTS ix_videos_user_id;
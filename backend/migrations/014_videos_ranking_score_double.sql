@@ -0,0 +1,20 @@
+-- Store videos.ranking_score as double precision (fixed 8 bytes, decoded straight to a Python
+-- float) instead of NUMERIC(12, 4). A generated column's expression cannot be changed in place,
+-- so the column and the feed index on it are recreated; this rewrites the table.
+-- psql $DATABASE_URL -f migrations/014_videos_ranking_score_double.sql
+
+BEGIN;
+
+DROP INDEX IF EXISTS ix_videos_feed;
+
+ALTER TABLE videos DROP COLUMN ranking_score;
+
+ALTER TABLE videos
+    ADD COLUMN ranking_score DOUBLE PRECISION
+    GENERATED ALWAYS AS ((likes_count - dislikes_count)::double precision / (views_count + 1)) STORED;
+
+CREATE INDEX ix_videos_feed
+    ON videos ((COALESCE(ranking_score, 0)) DESC, created_at DESC, id DESC)
+    WHERE status = 'COMPLETED' AND is_published = true;
+
+COMMIT;
@@ -0,0 +1,6 @@
+-- ix_video_reactions_user_video_reaction (user_id, video_id) INCLUDE (reaction) and
+-- ix_video_reactions_user_created (user_id, created_at DESC, id DESC) both lead with user_id,
+-- so the single-column index only adds a third B-tree to maintain on every reaction write.
+-- Run outside a transaction (CONCURRENTLY): psql $DATABASE_URL -f migrations/015_drop_video_reactions_user_id_index.sql
+
+DROP INDEX CONCURRENTLY IF EXISTS ix_video_reactions_user_id;